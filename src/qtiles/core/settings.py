@@ -280,6 +280,10 @@ class QTilesSettings:
     def did_last_launch_fail(self, value: bool) -> None:
         self.__settings.setValue(self.KEY_DID_LAST_LAUNCH_FAIL, value)
 
+    def sync(self) -> None:
+        """Write all pending changes to permanent storage at once."""
+        self.__settings.sync()
+
     @classmethod
     def __update_settings(cls) -> None:
         """Perform one-time migration from old QSettings storage."""
@@ -1,10 +1,12 @@
 from typing import Optional
 
-from qgis.core import QgsApplication, QgsCoordinateReferenceSystem
+from qgis.core import QgsApplication
 from qgis.gui import QgsExtentWidget
 from qgis.PyQt.QtWidgets import QAction, QToolButton, QWidget
 from qgis.utils import iface
 
+from qtiles.qtiles_utils import geographic_crs
+
 
 class QTilesExtentWidget(QgsExtentWidget):
     """
@@ -22,7 +24,7 @@ class QTilesExtentWidget(QgsExtentWidget):
         self._map_canvas = iface.mapCanvas()
 
         self.setMapCanvas(self._map_canvas)
-        self.setOutputCrs(QgsCoordinateReferenceSystem.fromEpsgId(4326))
+        self.setOutputCrs(geographic_crs())
         self.clear()
 
         self.__extend_toolbutton_menu()
@@ -25,7 +25,8 @@
 #
 # ******************************************************************************
 import math
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from qgis.core import (
     QgsCoordinateReferenceSystem,
@@ -39,6 +40,39 @@ from qtiles.tile import Tile
 
 TILES_COUNT_TRESHOLD = 10000
 
+# Fraction of a tile within which an extent bound snaps to the tile edge
+TILE_INDEX_TOLERANCE = 1e-6
+
+WEB_MERCATOR_MAX_LATITUDE = math.degrees(math.atan(math.sinh(math.pi)))
+WEB_MERCATOR_EXTENT = QgsRectangle(
+    -180, -WEB_MERCATOR_MAX_LATITUDE, 180, WEB_MERCATOR_MAX_LATITUDE
+)
+
+TransformsCache = Dict[Tuple[str, str], QgsCoordinateTransform]
+
+
+@lru_cache(maxsize=None)
+def geographic_crs() -> QgsCoordinateReferenceSystem:
+    """
+    Returns the shared EPSG:4326 coordinate reference system.
+
+    The CRS is created once, so the CRS database is not queried
+    again on every call.
+
+    :returns: The WGS84 geographic coordinate reference system.
+    """
+    return QgsCoordinateReferenceSystem.fromEpsgId(4326)
+
+
+@lru_cache(maxsize=None)
+def web_mercator_crs() -> QgsCoordinateReferenceSystem:
+    """
+    Returns the shared EPSG:3857 coordinate reference system.
+
+    :returns: The Web Mercator coordinate reference system.
+    """
+    return QgsCoordinateReferenceSystem.fromEpsgId(3857)
+
 
 def compute_target_extent(extent: QgsRectangle) -> QgsRectangle:
     """
@@ -50,69 +84,356 @@ def compute_target_extent(extent: QgsRectangle) -> QgsRectangle:
     :return: The clamped extent within valid geographic bounds.
     :rtype: QgsRectangle
     """
-    arctan_sinh_pi = math.degrees(math.atan(math.sinh(math.pi)))
-    return extent.intersect(
-        QgsRectangle(-180, -arctan_sinh_pi, 180, arctan_sinh_pi)
+    return extent.intersect(WEB_MERCATOR_EXTENT)
+
+
+def crs_cache_key(crs: QgsCoordinateReferenceSystem) -> str:
+    """
+    Returns a key identifying the CRS in transform caches.
+
+    :param crs: The coordinate reference system.
+
+    :returns: The CRS auth id, or its WKT definition for custom CRSs.
+    """
+    return crs.authid() or crs.toWkt()
+
+
+def cached_transform(
+    source_crs: QgsCoordinateReferenceSystem,
+    destination_crs: QgsCoordinateReferenceSystem,
+    transforms_cache: Optional[TransformsCache] = None,
+) -> QgsCoordinateTransform:
+    """
+    Returns a coordinate transform between the given CRSs.
+
+    Transforms are created with the project transform context and
+    stored in the cache, so every CRS pair is set up only once.
+
+    :param source_crs: The source coordinate reference system.
+    :param destination_crs: The destination coordinate reference system.
+    :param transforms_cache: Optional cache of already created transforms.
+
+    :returns: The coordinate transform.
+    """
+    if transforms_cache is None:
+        transforms_cache = {}
+
+    key = (crs_cache_key(source_crs), crs_cache_key(destination_crs))
+    crs_transform = transforms_cache.get(key)
+    if crs_transform is None:
+        crs_transform = QgsCoordinateTransform(
+            source_crs, destination_crs, QgsProject.instance()
+        )
+        transforms_cache[key] = crs_transform
+
+    return crs_transform
+
+
+def layers_geographic_extents(
+    layers: List[QgsMapLayer],
+    transforms_cache: Optional[TransformsCache] = None,
+) -> List[QgsRectangle]:
+    """
+    Transforms the extents of the given layers to EPSG:4326.
+
+    :param layers: A list of map layers.
+    :param transforms_cache: Optional cache of already created transforms.
+
+    :returns: Layer extents in geographic coordinates, in layer order.
+    """
+    if transforms_cache is None:
+        transforms_cache = {}
+
+    wgs84 = geographic_crs()
+
+    return [
+        cached_transform(layer.crs(), wgs84, transforms_cache).transform(
+            layer.extent()
+        )
+        for layer in layers
+    ]
+
+
+def tile_index_range(
+    extent: QgsRectangle, zoom: int, tms: int
+) -> Tuple[int, int, int, int]:
+    """
+    Computes the range of tile indices intersecting the extent.
+
+    Tile indices are derived directly from the extent bounds using the
+    slippy map formulas, so no tile objects are created. A tile touching
+    the extent boundary is considered intersecting, which matches
+    :py:meth:`QgsRectangle.intersects` semantics. The forward formulas
+    and the inverse ones used by :py:class:`Tile` round differently,
+    so bounds within ``TILE_INDEX_TOLERANCE`` of a tile edge count
+    as lying on it.
+
+    :param extent: The geographic extent (EPSG:4326).
+    :param zoom: The zoom level.
+    :param tms: TMS orientation multiplier (1 or -1).
+
+    :returns: Inclusive ``(x_min, x_max, y_min, y_max)`` tile indices.
+    """
+    n = 1 << zoom
+
+    def tile_x(longitude: float) -> float:
+        return (longitude + 180.0) / 360.0 * n
+
+    def tile_y(latitude: float) -> float:
+        latitude_rad = math.radians(latitude)
+        return (1.0 - math.asinh(math.tan(latitude_rad)) / math.pi) / 2.0 * n
+
+    tolerance = TILE_INDEX_TOLERANCE
+    x_min = max(0, math.ceil(tile_x(extent.xMinimum()) - tolerance) - 1)
+    x_max = min(n - 1, math.floor(tile_x(extent.xMaximum()) + tolerance))
+    y_min = max(0, math.ceil(tile_y(extent.yMaximum()) - tolerance) - 1)
+    y_max = min(n - 1, math.floor(tile_y(extent.yMinimum()) + tolerance))
+
+    if tms == -1:
+        y_min, y_max = n - 1 - y_max, n - 1 - y_min
+
+    return x_min, x_max, y_min, y_max
+
+
+def iter_tiles(
+    tms: int,
+    layers: List[QgsMapLayer],
+    extent: QgsRectangle,
+    min_zoom: int,
+    max_zoom: int,
+    render_outside_tiles: bool,
+    transforms_cache: Optional[TransformsCache] = None,
+) -> Iterator[Tile]:
+    """
+    Lazily enumerates the tiles to be generated.
+
+    Tiles are enumerated level by level: for every zoom level the range
+    of tile indices covered by the extent is computed directly, so only
+    the tiles intersecting the extent are ever created. Tiles outside
+    the layers extents are skipped unless rendering outside tiles
+    is enabled.
+
+    :param tms: TMS orientation multiplier (1 or -1).
+    :param layers: A list of map layers to consider for tile generation.
+    :param extent: The geographical extent for tile generation.
+    :param min_zoom: The minimum zoom level.
+    :param max_zoom: The maximum zoom level.
+    :param render_outside_tiles: Whether to include tiles outside themap extent.
+    :param transforms_cache: Optional cache of already created transforms.
+
+    :returns: An iterator over the tiles to be generated.
+    """
+    # Layer extents are prepared eagerly so that only plain geometry
+    # is left for the generator, which may be consumed by another thread.
+    enumeration = _prepare_enumeration(
+        layers, extent, render_outside_tiles, transforms_cache
     )
+    if enumeration is None:
+        return iter(())
+
+    extent, layers_extents = enumeration
+    return _generate_tiles(tms, layers_extents, extent, min_zoom, max_zoom)
 
 
 def count_tiles(
-    tile: Tile,
+    tms: int,
     layers: List[QgsMapLayer],
     extent: QgsRectangle,
     min_zoom: int,
     max_zoom: int,
     render_outside_tiles: bool,
-) -> Optional[List[Tile]]:
+    transforms_cache: Optional[TransformsCache] = None,
+) -> Optional[int]:
     """
-    Recursively counts the number of tiles to be generated.
+    Counts the tiles :py:func:`iter_tiles` would enumerate
+    without keeping them in memory.
 
-    This method calculates the tiles required for the specified extent
-    and zoom levels. It supports rendering tiles outside the map extent
-    if enabled.
+    The count is computed from the tile index ranges only,
+    no tiles are created.
 
-    :param tile: The initial tile to start counting from.
+    :param tms: TMS orientation multiplier (1 or -1).
     :param layers: A list of map layers to consider for tile generation.
     :param extent: The geographical extent for tile generation.
     :param min_zoom: The minimum zoom level.
     :param max_zoom: The maximum zoom level.
     :param render_outside_tiles: Whether to include tiles outside themap extent.
+    :param transforms_cache: Optional cache of already created transforms.
 
-    :returns: A list of tiles to be generated or None if no tiles are required.
+    :returns: The number of tiles to be generated or None if the extent
+        does not intersect the tile pyramid.
     """
-    tile_extent = tile.to_rectangle()
-    if not extent.intersects(tile_extent):
+    if not extent.intersects(WEB_MERCATOR_EXTENT):
         return None
 
-    tiles = []
-    if min_zoom <= tile.z <= max_zoom:
-        if not render_outside_tiles:
-            for layer in layers:
-                crs_transform = QgsCoordinateTransform(
-                    layer.crs(),
-                    QgsCoordinateReferenceSystem.fromEpsgId(4326),
-                    QgsProject.instance(),
-                )
-                if crs_transform.transform(layer.extent()).intersects(
-                    tile_extent
-                ):
-                    tiles.append(tile)
-                    break
-        else:
-            tiles.append(tile)
-    if tile.z < max_zoom:
-        for x in (2 * tile.x, 2 * tile.x + 1):
-            for y in (2 * tile.y, 2 * tile.y + 1):
-                sub_tile = Tile(x, y, tile.z + 1, tile.tms)
-                sub_tiles = count_tiles(
-                    sub_tile,
-                    layers,
-                    extent,
-                    min_zoom,
-                    max_zoom,
-                    render_outside_tiles,
+    enumeration = _prepare_enumeration(
+        layers, extent, render_outside_tiles, transforms_cache
+    )
+    if enumeration is None:
+        return 0
+
+    extent, layers_extents = enumeration
+
+    tiles_count = 0
+    for zoom in range(min_zoom, max_zoom + 1):
+        for y_min, y_max, x_ranges in _tile_bands(
+            tms, layers_extents, extent, zoom
+        ):
+            row_tiles_count = sum(
+                x_max - x_min + 1 for x_min, x_max in x_ranges
+            )
+            tiles_count += row_tiles_count * (y_max - y_min + 1)
+
+    return tiles_count
+
+
+def _prepare_enumeration(
+    layers: List[QgsMapLayer],
+    extent: QgsRectangle,
+    render_outside_tiles: bool,
+    transforms_cache: Optional[TransformsCache],
+) -> Optional[Tuple[QgsRectangle, Optional[List[QgsRectangle]]]]:
+    """
+    Narrows down the area to enumerate tiles in.
+
+    :param layers: A list of map layers to consider for tile generation.
+    :param extent: The geographical extent for tile generation.
+    :param render_outside_tiles: Whether to include tiles outside themap extent.
+    :param transforms_cache: Optional cache of already created transforms.
+
+    :returns: None if there are no tiles to generate. Otherwise the extent
+        to enumerate tiles in and the geographic extents of the layers
+        every tile has to intersect, or None for the extents if every
+        tile within the extent has to be generated.
+    """
+    if not extent.intersects(WEB_MERCATOR_EXTENT):
+        return None
+
+    if render_outside_tiles:
+        return extent, None
+
+    layers_extents = layers_geographic_extents(layers, transforms_cache)
+    if not layers_extents:
+        return None
+
+    if any(layer_extent.contains(extent) for layer_extent in layers_extents):
+        # Every tile intersecting the extent intersects such a layer
+        # as well, e.g. a world-wide basemap.
+        return extent, None
+
+    layers_bbox = QgsRectangle(layers_extents[0])
+    for layer_extent in layers_extents[1:]:
+        layers_bbox.combineExtentWith(layer_extent)
+
+    # Tiles outside the combined layers extent are never kept, so there
+    # is no need to visit them. Layers apart from the extent may still
+    # reach the tiles along its edges, the extent is kept as is then.
+    if extent.intersects(layers_bbox):
+        extent = extent.intersect(layers_bbox)
+
+    return extent, layers_extents
+
+
+def _generate_tiles(
+    tms: int,
+    layers_extents: Optional[List[QgsRectangle]],
+    extent: QgsRectangle,
+    min_zoom: int,
+    max_zoom: int,
+) -> Iterator[Tile]:
+    """
+    Yields the tiles intersecting the extent level by level.
+
+    :param tms: TMS orientation multiplier (1 or -1).
+    :param layers_extents: Geographic extents of the layers every tile
+        has to intersect, or None to yield every tile.
+    :param extent: The geographical extent for tile generation.
+    :param min_zoom: The minimum zoom level.
+    :param max_zoom: The maximum zoom level.
+
+    :returns: An iterator over the tiles to be generated.
+    """
+    for zoom in range(min_zoom, max_zoom + 1):
+        for y_min, y_max, x_ranges in _tile_bands(
+            tms, layers_extents, extent, zoom
+        ):
+            for y in range(y_min, y_max + 1):
+                for x_min, x_max in x_ranges:
+                    for x in range(x_min, x_max + 1):
+                        yield Tile(x, y, zoom, tms)
+
+
+def _tile_bands(
+    tms: int,
+    layers_extents: Optional[List[QgsRectangle]],
+    extent: QgsRectangle,
+    zoom: int,
+) -> Iterator[Tuple[int, int, List[Tuple[int, int]]]]:
+    """
+    Splits the tiles of a zoom level into bands of rows
+    intersecting the same layers.
+
+    A tile intersects a layer exactly when its indices fall into
+    the layer index range, so every band is described by the ranges
+    of tile columns covered by its layers, merged and sorted.
+
+    :param tms: TMS orientation multiplier (1 or -1).
+    :param layers_extents: Geographic extents of the layers every tile
+        has to intersect, or None to keep every tile.
+    :param extent: The geographical extent for tile generation.
+    :param zoom: The zoom level.
+
+    :returns: An iterator over inclusive ``(y_min, y_max, x_ranges)``
+        bands, where ``x_ranges`` holds inclusive ``(x_min, x_max)``
+        column ranges.
+    """
+    x_min, x_max, y_min, y_max = tile_index_range(extent, zoom, tms)
+    if x_min > x_max or y_min > y_max:
+        return
+
+    if layers_extents is None:
+        yield y_min, y_max, [(x_min, x_max)]
+        return
+
+    # Layers are not clipped to the extent, and ranges missing the extent
+    # would split its rows into bands outside of it.
+    layers_ranges = [
+        layer_range
+        for layer_range in (
+            tile_index_range(layer_extent, zoom, tms)
+            for layer_extent in layers_extents
+        )
+        if layer_range[0] <= x_max
+        and layer_range[1] >= x_min
+        and layer_range[2] <= y_max
+        and layer_range[3] >= y_min
+    ]
+
+    boundaries = {y_min, y_max + 1}
+    for _, _, layer_y_min, layer_y_max in layers_ranges:
+        boundaries.add(max(y_min, layer_y_min))
+        boundaries.add(min(y_max, layer_y_max) + 1)
+    sorted_boundaries = sorted(boundaries)
+
+    for band_start, band_end in zip(sorted_boundaries, sorted_boundaries[1:]):
+        x_ranges: List[Tuple[int, int]] = []
+        for layer_x_min, layer_x_max, layer_y_min, layer_y_max in sorted(
+            layers_ranges
+        ):
+            if not layer_y_min <= band_start <= layer_y_max:
+                continue
+
+            range_start = max(x_min, layer_x_min)
+            range_end = min(x_max, layer_x_max)
+            if range_start > range_end:
+                continue
+
+            if x_ranges and range_start <= x_ranges[-1][1] + 1:
+                x_ranges[-1] = (
+                    x_ranges[-1][0],
+                    max(x_ranges[-1][1], range_end),
                 )
-                if sub_tiles:
-                    tiles.extend(sub_tiles)
+            else:
+                x_ranges.append((range_start, range_end))
 
-    return tiles
+        if x_ranges:
+            yield band_start, band_end - 1, x_ranges
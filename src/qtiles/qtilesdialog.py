@@ -25,7 +25,7 @@
 import os
 import shutil
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
     from qgis.gui import QgisInterface
@@ -33,9 +33,10 @@ if TYPE_CHECKING:
 from qgis.core import Qgis, QgsApplication, QgsMapLayer, QgsProject
 from qgis.gui import QgsFileWidget, QgsGui
 from qgis.PyQt import uic
-from qgis.PyQt.QtCore import QSize, Qt, pyqtSlot
+from qgis.PyQt.QtCore import QSize, Qt, QTimer, pyqtSlot
 from qgis.PyQt.QtGui import QCloseEvent, QIcon
 from qgis.PyQt.QtWidgets import (
+    QAbstractButton,
     QComboBox,
     QDialog,
     QDialogButtonBox,
@@ -57,10 +58,12 @@ from qtiles.core.settings import QTilesSettings
 from qtiles.notifier.message_bar_notifier import MessageBarNotifier
 from qtiles.restrictions import OpenStreetMapRestriction
 from qtiles.shared.filesystem import reveal_in_file_manager
-from qtiles.tile import Tile
+from qtiles.shared.signals import signals_blocked
 from qtiles.tilingthread import TilingThread
 from qtiles.writers.enums import TilesWriterMode
 
+OutputOptionState = Tuple[QAbstractButton, bool, Optional[bool]]
+
 FORM_CLASS, _ = uic.loadUiType(
     os.path.join(os.path.dirname(__file__), "ui/qtilesdialogbase.ui")
 )
@@ -115,6 +118,11 @@ class QTilesDialog(QDialog, FORM_CLASS):
 
         self.work_thread = None
 
+        self.__transforms_cache: utils.TransformsCache = {}
+        QgsProject.instance().transformContextChanged.connect(
+            self.__on_transform_context_changed
+        )
+
         self.button_close = self.buttonBox.button(
             QDialogButtonBox.StandardButton.Close
         )
@@ -125,6 +133,8 @@ class QTilesDialog(QDialog, FORM_CLASS):
 
         self.about_button.clicked.connect(self.__show_about)
 
+        self.__output_options_states = self.__build_output_options_states()
+
         self.manageGui()
 
     def _on_run_button_clicked(self) -> None:
@@ -173,8 +183,10 @@ class QTilesDialog(QDialog, FORM_CLASS):
             self.tr("Select output path…")
         )
 
-        self._populate_output_format_combo_box()
-        self._populate_tile_image_format_combo_data()
+        # Dependent widgets are synchronized once the saved state is loaded.
+        with signals_blocked(self.output_format_combo_box, self.cmbFormat):
+            self._populate_output_format_combo_box()
+            self._populate_tile_image_format_combo_data()
 
         self.progressBar.setVisible(False)
 
@@ -237,7 +249,10 @@ class QTilesDialog(QDialog, FORM_CLASS):
             )
         )
 
-        self._load_settings_to_ui()
+        # Restoring the saved state reads every setting and triggers
+        # the dependent widget slots, so postpone it until the dialog
+        # has been painted for the first time.
+        QTimer.singleShot(0, self._load_settings_to_ui)
 
     def _load_settings_to_ui(self) -> None:
         """
@@ -256,8 +271,12 @@ class QTilesDialog(QDialog, FORM_CLASS):
 
         self.leRootDir.setText(tileset_name)
 
-        self.output_format_combo_box.setCurrentIndex(
-            settings.tiles_writer_mode
+        with signals_blocked(self.output_format_combo_box):
+            self.output_format_combo_box.setCurrentIndex(
+                settings.tiles_writer_mode
+            )
+        self.__on_output_format_changed(
+            self.output_format_combo_box.currentIndex()
         )
 
         self.min_zoom_level_spinbox.set_value(settings.min_zoom)
@@ -265,7 +284,8 @@ class QTilesDialog(QDialog, FORM_CLASS):
         self.tile_size_spinbox.setValue(settings.tile_size)
         self.spinbox_dpi.setValue(settings.dpi)
 
-        self.cmbFormat.setCurrentIndex(settings.tile_output_format)
+        with signals_blocked(self.cmbFormat):
+            self.cmbFormat.setCurrentIndex(settings.tile_output_format)
         self.spnQuality.setValue(settings.jpg_quality)
 
         self.chkAntialiasing.setChecked(settings.enable_antialiasing)
@@ -282,6 +302,14 @@ class QTilesDialog(QDialog, FORM_CLASS):
 
         self._on_tile_image_format_changed()
 
+    @pyqtSlot()
+    def __on_transform_context_changed(self) -> None:
+        """
+        Drops cached coordinate transforms built with the previous
+        project transform context.
+        """
+        self.__transforms_cache.clear()
+
     @pyqtSlot()
     def __show_about(self) -> None:
         """
@@ -341,21 +369,23 @@ class QTilesDialog(QDialog, FORM_CLASS):
         tms_convention = self.chkTMSConvention.isChecked()
         use_tms = -1 if tms_convention else 1
 
-        initial_tile = Tile(0, 0, 0, use_tms)
         min_zoom = self.min_zoom_level_spinbox.value()
         max_zoom = self.max_zoom_level_spinbox.value()
         render_outside_tiles = self.chkRenderOutsideTiles.isChecked()
 
-        tiles = utils.count_tiles(
-            initial_tile,
+        tiles_parameters = (
+            use_tms,
             layers,
             target_extent,
             min_zoom,
             max_zoom,
             render_outside_tiles,
+            self.__transforms_cache,
         )
 
-        if tiles is None:
+        tiles_count = utils.count_tiles(*tiles_parameters)
+
+        if tiles_count is None:
             self.notifier.dismiss_all()
             self.notifier.display_message(
                 self.tr(
@@ -367,8 +397,6 @@ class QTilesDialog(QDialog, FORM_CLASS):
             )
             return
 
-        tiles_count = len(tiles)
-
         if tiles_count > utils.TILES_COUNT_TRESHOLD:
             if not self.__confirm_continue_threshold(
                 utils.TILES_COUNT_TRESHOLD
@@ -416,7 +444,8 @@ class QTilesDialog(QDialog, FORM_CLASS):
         self.__save_settings()
 
         self.work_thread = TilingThread(
-            tiles,
+            utils.iter_tiles(*tiles_parameters),
+            tiles_count,
             layers,
             writer_mode,
             target_extent,
@@ -478,12 +507,15 @@ class QTilesDialog(QDialog, FORM_CLASS):
         self.progressBar.setFormat(message)
         self.progressBar.setRange(0, value)
 
-    @pyqtSlot()
-    def updateProgress(self) -> None:
+    @pyqtSlot(int)
+    def updateProgress(self, rendered_count: int) -> None:
         """
-        Updates the progress bar by incrementing its current value.
+        Updates the progress bar by advancing its current value.
+
+        :param rendered_count: The number of tiles rendered since
+                               the previous update.
         """
-        self.progressBar.setValue(self.progressBar.value() + 1)
+        self.progressBar.setValue(self.progressBar.value() + rendered_count)
 
     @pyqtSlot()
     def processInterrupted(self) -> None:
@@ -618,45 +650,76 @@ class QTilesDialog(QDialog, FORM_CLASS):
 
         self.__configure_output_path_file_widget(writer_mode)
 
-        self.chkWriteOverview.setEnabled(True)
-        self.chkWriteJson.setEnabled(True)
-        self.chkWriteMapurl.setEnabled(False)
-        self.chkWriteViewer.setEnabled(False)
-
-        self.chkMBTilesCompression.setEnabled(False)
-        self.chkTMSConvention.setEnabled(True)
-
-        if writer_mode.is_directory:
-            self.chkWriteMapurl.setEnabled(True)
-            self.chkWriteViewer.setEnabled(True)
-            return
-
-        self.chkWriteMapurl.setChecked(False)
-        self.chkWriteViewer.setChecked(False)
-
-        if writer_mode is TilesWriterMode.MBTILES:
-            self.chkMBTilesCompression.setEnabled(True)
-
-            self.chkTMSConvention.setChecked(True)
-            self.chkTMSConvention.setEnabled(False)
-            return
+        for checkbox, is_enabled, is_checked in self.__output_options_states[
+            writer_mode
+        ]:
+            if is_checked is not None:
+                checkbox.setChecked(is_checked)
+            checkbox.setEnabled(is_enabled)
 
         if writer_mode is TilesWriterMode.PMTILES:
             self.tile_size_spinbox.setValue(512)
 
-            self.chkTMSConvention.setChecked(False)
-            self.chkTMSConvention.setEnabled(False)
-            return
-
-        if writer_mode is TilesWriterMode.NGM:
-            self.chkWriteOverview.setChecked(False)
-            self.chkWriteOverview.setEnabled(False)
-
-            self.chkWriteJson.setChecked(False)
-            self.chkWriteJson.setEnabled(False)
-
-            self.chkTMSConvention.setChecked(False)
-            self.chkTMSConvention.setEnabled(False)
+    def __build_output_options_states(
+        self,
+    ) -> Dict[TilesWriterMode, Tuple[OutputOptionState, ...]]:
+        """
+        Build the output options state table for every tiles writer mode.
+
+        Every entry holds the option checkbox, whether it is enabled,
+        and the state it is forced to, or ``None`` to keep the user choice.
+
+        :returns: Output options states keyed by tiles writer mode.
+        """
+        overview_checkbox = self.chkWriteOverview
+        json_checkbox = self.chkWriteJson
+        mapurl_checkbox = self.chkWriteMapurl
+        viewer_checkbox = self.chkWriteViewer
+        compression_checkbox = self.chkMBTilesCompression
+        tms_checkbox = self.chkTMSConvention
+
+        return {
+            TilesWriterMode.DIR: (
+                (overview_checkbox, True, None),
+                (json_checkbox, True, None),
+                (mapurl_checkbox, True, None),
+                (viewer_checkbox, True, None),
+                (compression_checkbox, False, None),
+                (tms_checkbox, True, None),
+            ),
+            TilesWriterMode.ZIP: (
+                (overview_checkbox, True, None),
+                (json_checkbox, True, None),
+                (mapurl_checkbox, False, False),
+                (viewer_checkbox, False, False),
+                (compression_checkbox, False, None),
+                (tms_checkbox, True, None),
+            ),
+            TilesWriterMode.MBTILES: (
+                (overview_checkbox, True, None),
+                (json_checkbox, True, None),
+                (mapurl_checkbox, False, False),
+                (viewer_checkbox, False, False),
+                (compression_checkbox, True, None),
+                (tms_checkbox, False, True),
+            ),
+            TilesWriterMode.PMTILES: (
+                (overview_checkbox, True, None),
+                (json_checkbox, True, None),
+                (mapurl_checkbox, False, False),
+                (viewer_checkbox, False, False),
+                (compression_checkbox, False, None),
+                (tms_checkbox, False, False),
+            ),
+            TilesWriterMode.NGM: (
+                (overview_checkbox, False, False),
+                (json_checkbox, False, False),
+                (mapurl_checkbox, False, False),
+                (viewer_checkbox, False, False),
+                (compression_checkbox, False, None),
+                (tms_checkbox, False, False),
+            ),
+        }
 
     @pyqtSlot(int)
     def __on_min_zoom_level_changed(self, min_zoom_level: int) -> None:
@@ -735,13 +798,11 @@ class QTilesDialog(QDialog, FORM_CLASS):
         settings = QTilesSettings()
 
         path = Path(self.output_path_file_widget.filePath())
+        last_output_dir = str(path.parent) if path.suffix else str(path)
+        tileset_name = self.leRootDir.text()
 
-        if path.suffix:
-            settings.last_output_dir = str(path.parent)
-        else:
-            settings.last_output_dir = str(path)
-
-        settings.tileset_name = self.leRootDir.text()
+        settings.last_output_dir = last_output_dir
+        settings.tileset_name = tileset_name
         settings.tiles_writer_mode = (
             self.output_format_combo_box.currentIndex()
         )
@@ -764,8 +825,13 @@ class QTilesDialog(QDialog, FORM_CLASS):
         settings.write_overview = self.chkWriteOverview.isChecked()
         settings.write_mapurl = self.chkWriteMapurl.isChecked()
         settings.write_leaflet_viewer = self.chkWriteViewer.isChecked()
+        settings.sync()
 
-        self._load_settings_to_ui()
+        # Widgets already show the saved values, only the file dialog
+        # root depends on them.
+        self.output_path_file_widget.setDefaultRoot(
+            last_output_dir + f"/{tileset_name}"
+        )
 
     def __validate_osm_restriction(
         self, layers: List[QgsMapLayer], tiles_count: int
@@ -811,7 +877,10 @@ class QTilesDialog(QDialog, FORM_CLASS):
         if reply == QMessageBox.StandardButton.No:
             return None
 
-        return [layer for layer in layers if layer not in skipped_layers]
+        skipped_layers_ids = {layer.id() for layer in skipped_layers}
+        return [
+            layer for layer in layers if layer.id() not in skipped_layers_ids
+        ]
 
     def __confirm_and_overwrite_output_path(
         self, output_path: Path, description: str, is_directory: bool = False
@@ -930,15 +999,15 @@ class QTilesDialog(QDialog, FORM_CLASS):
             QComboBox.SizeAdjustPolicy.AdjustToContents
         )
 
-        writer_modes: Dict[TilesWriterMode, str] = {
-            TilesWriterMode.DIR: self.tr("Directory"),
-            TilesWriterMode.ZIP: self.tr("ZIP archive"),
-            TilesWriterMode.MBTILES: self.tr("MBTiles"),
-            TilesWriterMode.PMTILES: self.tr("PMTiles"),
-            TilesWriterMode.NGM: self.tr("NextGIS Mobile"),
-        }
+        writer_modes: Tuple[Tuple[TilesWriterMode, str], ...] = (
+            (TilesWriterMode.DIR, self.tr("Directory")),
+            (TilesWriterMode.ZIP, self.tr("ZIP archive")),
+            (TilesWriterMode.MBTILES, self.tr("MBTiles")),
+            (TilesWriterMode.PMTILES, self.tr("PMTiles")),
+            (TilesWriterMode.NGM, self.tr("NextGIS Mobile")),
+        )
 
-        for writer_mode, label in writer_modes.items():
+        for writer_mode, label in writer_modes:
             self._add_output_format_item(writer_mode, label)
 
     def _add_output_format_item(
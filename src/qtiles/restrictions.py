@@ -1,8 +1,81 @@
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import List, Tuple
+from urllib.parse import urlsplit
 
 from qgis.core import QgsMapLayer, QgsProviderRegistry
-from qgis.PyQt.QtCore import QCoreApplication, QUrl
+from qgis.PyQt.QtCore import QT_TRANSLATE_NOOP, QCoreApplication
+
+OPENSTREETMAP_HOSTS = ("openstreetmap.org", "osm.org")
+
+OPENSTREETMAP_SKIPPED_LAYERS_MESSAGE = QT_TRANSLATE_NOOP(
+    "LayerRestriction",
+    "The following OpenStreetMap layers were skipped because the operation "
+    "would lead to bulk downloading, which is prohibited by the "
+    "<a href='https://operations.osmfoundation.org/policies/tiles/'>OpenStreetMap Foundation Tile Usage Policy</a>:",
+)
+NO_LAYERS_REMAINING_MESSAGE = QT_TRANSLATE_NOOP(
+    "LayerRestriction",
+    "There are no layers remaining for tiling. "
+    "The operation has been cancelled.",
+)
+OPENSTREETMAP_RESTRICTION_HINT_MESSAGE = QT_TRANSLATE_NOOP(
+    "LayerRestriction",
+    "To avoid this restriction, try reducing the maximum zoom level in the settings "
+    "or increasing the zoom level in the map extent before running operation.",
+)
+
+OPENSTREETMAP_RESTRICTION_TEMPLATE = "<p>%s</p><p>%s</p>%s<p>%s</p>"
+
+
+@lru_cache(maxsize=None)
+def _translated_restriction_messages() -> Tuple[str, str, str]:
+    """
+    Translates the OpenStreetMap restriction messages once.
+
+    :returns: Translated skipped layers, no remaining layers
+        and restriction hint messages.
+    """
+    return (
+        QCoreApplication.translate(
+            "LayerRestriction", OPENSTREETMAP_SKIPPED_LAYERS_MESSAGE
+        ),
+        QCoreApplication.translate(
+            "LayerRestriction", NO_LAYERS_REMAINING_MESSAGE
+        ),
+        QCoreApplication.translate(
+            "LayerRestriction", OPENSTREETMAP_RESTRICTION_HINT_MESSAGE
+        ),
+    )
+
+
+def _is_wms_layer(layer: QgsMapLayer) -> bool:
+    """
+    Determines whether a layer is served by the WMS/XYZ data provider.
+
+    :param layer: The map layer to check.
+    """
+    return layer.providerType().lower() == "wms"
+
+
+@lru_cache(maxsize=512)
+def _is_openstreetmap_source(source: str) -> bool:
+    """
+    Determines whether a WMS/XYZ layer data source points to OpenStreetMap.
+
+    Results are cached by source, so a changed layer source
+    is classified again.
+
+    :param source: The layer data source string.
+    """
+    metadata = QgsProviderRegistry.instance().providerMetadata("wms")
+    uri = metadata.decodeUri(source)
+    try:
+        host = urlsplit(uri.get("url", "")).hostname or ""
+    except ValueError:
+        return False
+
+    return host.endswith(OPENSTREETMAP_HOSTS)
 
 
 class LayerRestriction(ABC):
@@ -54,15 +127,9 @@ class OpenStreetMapRestriction(LayerRestriction):
 
         :param layer: The map layer to check.
         """
-        if layer.providerType().lower() != "wms":
-            return False
-
-        metadata = QgsProviderRegistry.instance().providerMetadata("wms")
-        uri = metadata.decodeUri(layer.source())
-        url = QUrl(uri.get("url", ""))
-        host = url.host().lower()
-
-        return host.endswith("openstreetmap.org") or host.endswith("osm.org")
+        return _is_wms_layer(layer) and _is_openstreetmap_source(
+            layer.source()
+        )
 
     def validate_restriction(
         self, layers: List[QgsMapLayer], tiles_count: int
@@ -85,45 +152,27 @@ class OpenStreetMapRestriction(LayerRestriction):
         if tiles_count <= self.MAXIMUM_OPENSTREETMAP_TILES_FETCH:
             return False, "", []
 
+        wms_layers = [layer for layer in layers if _is_wms_layer(layer)]
         osm_layers = [
-            layer for layer in layers if self.is_openstreetmap_layer(layer)
+            layer
+            for layer in wms_layers
+            if _is_openstreetmap_source(layer.source())
         ]
 
         if not osm_layers:
             return False, "", []
 
         layers_list_html = "<br>".join(layer.name() for layer in osm_layers)
-        message = f"""
-        <p>{
-            QCoreApplication.translate(
-                "LayerRestriction",
-                "The following OpenStreetMap layers were skipped because the operation "
-                "would lead to bulk downloading, which is prohibited by the "
-                "<a href='https://operations.osmfoundation.org/policies/tiles/'>OpenStreetMap Foundation Tile Usage Policy</a>:",
-            )
-        }</p>
-        <p>{layers_list_html}</p>
-        """
-
-        if len(osm_layers) == len(layers):
-            message += f"""
-            <p>{
-                QCoreApplication.translate(
-                    "LayerRestriction",
-                    "There are no layers remaining for tiling. "
-                    "The operation has been cancelled.",
-                )
-            }</p>
-            """
-
-        message += f"""
-        <p>{
-            QCoreApplication.translate(
-                "LayerRestriction",
-                "To avoid this restriction, try reducing the maximum zoom level in the settings "
-                "or increasing the zoom level in the map extent before running operation.",
-            )
-        }</p>
-        """
+        skipped_layers_message, no_layers_message, hint_message = (
+            _translated_restriction_messages()
+        )
+        message = OPENSTREETMAP_RESTRICTION_TEMPLATE % (
+            skipped_layers_message,
+            layers_list_html,
+            f"<p>{no_layers_message}</p>"
+            if len(osm_layers) == len(layers)
+            else "",
+            hint_message,
+        )
 
         return True, message, osm_layers
@@ -0,0 +1,20 @@
+from contextlib import contextmanager
+from typing import Iterator
+
+from qgis.PyQt.QtCore import QObject
+
+
+@contextmanager
+def signals_blocked(*objects: QObject) -> Iterator[None]:
+    """Block signals of the given objects for the duration of the context.
+
+    The previous blocking state of every object is restored on exit.
+
+    :param objects: Objects whose signals should be blocked.
+    """
+    previous_states = [qobject.blockSignals(True) for qobject in objects]
+    try:
+        yield
+    finally:
+        for qobject, was_blocked in zip(objects, previous_states):
+            qobject.blockSignals(was_blocked)
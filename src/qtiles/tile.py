@@ -30,12 +30,16 @@ import math
 
 from qgis.core import QgsPointXY, QgsRectangle
 
+WEB_MERCATOR_HALF_SIZE = math.pi * 6378137.0
+
 
 class Tile:
     """
     Representation of a single map tile in XYZ/TMS tiling scheme.
     """
 
+    __slots__ = ("x", "y", "z", "tms")
+
     def __init__(
         self, x: int = 0, y: int = 0, z: int = 0, tms: int = 1
     ) -> None:
@@ -60,12 +64,7 @@ class Tile:
 
         :return: Geographic point in WGS84.
         """
-        n = math.pow(2, self.z)
-        longitude = float(self.x) / n * 360.0 - 180.0
-        latitude = self.tms * math.degrees(
-            math.atan(math.sinh(math.pi * (1.0 - 2.0 * float(self.y) / n)))
-        )
-        return QgsPointXY(longitude, latitude)
+        return self.__corner_point(self.x, self.y)
 
     def to_rectangle(self) -> QgsRectangle:
         """
@@ -75,12 +74,42 @@ class Tile:
 
         :return: Geographic rectangle in WGS84.
         """
-        top_left = self.to_point()
-        bottom_right = Tile(
-            self.x + 1,
-            self.y + 1,
-            self.z,
-            self.tms,
-        ).to_point()
+        top_left = self.__corner_point(self.x, self.y)
+        bottom_right = self.__corner_point(self.x + 1, self.y + 1)
 
         return QgsRectangle(top_left, bottom_right)
+
+    def to_web_mercator_rectangle(self) -> QgsRectangle:
+        """
+        Convert tile to a Web Mercator rectangle (EPSG:3857).
+
+        The bounds are computed analytically from the tile indices,
+        which gives the same result as reprojecting
+        :py:meth:`to_rectangle` without a coordinate transform.
+
+        :return: Rectangle in Web Mercator coordinates.
+        """
+        tile_size = 2.0 * WEB_MERCATOR_HALF_SIZE / math.pow(2, self.z)
+
+        x_min = self.x * tile_size - WEB_MERCATOR_HALF_SIZE
+        top = self.tms * (WEB_MERCATOR_HALF_SIZE - self.y * tile_size)
+        bottom = self.tms * (WEB_MERCATOR_HALF_SIZE - (self.y + 1) * tile_size)
+
+        return QgsRectangle(x_min, bottom, x_min + tile_size, top)
+
+    def __corner_point(self, x: int, y: int) -> QgsPointXY:
+        """
+        Convert grid corner coordinates at the tile zoom level
+        to a geographic point (EPSG:4326).
+
+        :param x: Grid corner X coordinate.
+        :param y: Grid corner Y coordinate.
+
+        :return: Geographic point in WGS84.
+        """
+        n = math.pow(2, self.z)
+        longitude = float(x) / n * 360.0 - 180.0
+        latitude = self.tms * math.degrees(
+            math.atan(math.sinh(math.pi * (1.0 - 2.0 * float(y) / n)))
+        )
+        return QgsPointXY(longitude, latitude)
@@ -22,13 +22,14 @@
 # MA 02110-1335 USA.
 #
 # ******************************************************************************
+import time
+from itertools import islice
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from qgis.core import (
     QgsApplication,
-    QgsCoordinateReferenceSystem,
-    QgsCoordinateTransform,
+    QgsCsException,
     QgsLabelingEngineSettings,
     QgsMapLayer,
     QgsMapRendererCustomPainterJob,
@@ -37,7 +38,7 @@ from qgis.core import (
     QgsRectangle,
 )
 from qgis.PyQt.QtCore import (
-    QMutex,
+    QSize,
     Qt,
     QThread,
     pyqtSignal,
@@ -45,7 +46,9 @@ from qgis.PyQt.QtCore import (
 from qgis.PyQt.QtGui import QColor, QImage, QPainter
 from qgis.utils import iface
 
+from qtiles import qtiles_utils as utils
 from qtiles import resources_rc  # noqa: F401
+from qtiles.core.compat import LayerType
 from qtiles.core.exceptions import TileGenerationError, TileGenerationWarning
 from qtiles.core.logging import logger
 from qtiles.tile import Tile
@@ -54,6 +57,13 @@ from qtiles.writers.save_tiles_options import SaveTilesOptions
 from qtiles.writers.tiles_artifacts_writer import TilesetArtifactsWriter
 from qtiles.writers.tiles_writer_factory import TilesWriterFactory
 
+RenderJob = Tuple[
+    Tile,
+    QImage,
+    Optional[QPainter],
+    Optional[QgsMapRendererCustomPainterJob],
+]
+
 
 class TilingThread(QThread):
     """
@@ -61,14 +71,18 @@ class TilingThread(QThread):
     """
 
     rangeChanged = pyqtSignal(str, int)
-    updateProgress = pyqtSignal()
+    updateProgress = pyqtSignal(int)
     processFinished = pyqtSignal()
     processInterrupted = pyqtSignal()
     processError = pyqtSignal()
 
+    PROGRESS_BATCH_SIZE: int = 64
+    PROGRESS_INTERVAL: float = 0.05
+
     def __init__(
         self,
-        tiles: List[Tile],
+        tiles: Iterable[Tile],
+        tiles_count: int,
         layers: List[QgsMapLayer],
         writer_mode: TilesWriterMode,
         extent: QgsRectangle,
@@ -92,7 +106,8 @@ class TilingThread(QThread):
         """
         Initializes the TilingThread with the given parameters.
 
-        :param tiles: A list of tiles to generate.
+        :param tiles: An iterable of tiles to generate.
+        :param tiles_count: The number of tiles in ``tiles``.
         :param layers: A list of map layers to render.
         :param writer_mode: Selected tiles writer mode.
         :param extent: The geographical extent for tile generation.
@@ -115,10 +130,10 @@ class TilingThread(QThread):
         :param viewer: Whether to generate a viewer for the tiles.
         """
         super().__init__()
-        self.mutex = QMutex()
-        self.stopMe = 0
+        self._stop_requested = False
         self.interrupted = False
         self.tiles = tiles
+        self.tiles_count = tiles_count
         self.writer_mode = writer_mode
         self.extent = extent
         self.min_zoom = min_zoom
@@ -138,29 +153,15 @@ class TilingThread(QThread):
         self.error: Optional[TileGenerationError] = None
         self.warning: Optional[TileGenerationWarning] = None
 
-        self.layersId = []
-        for layer in layers:
-            self.layersId.append(layer.id())
-
-        image = QImage(
-            tile_size, tile_size, QImage.Format.Format_ARGB32_Premultiplied
-        )
-
-        self.projector = QgsCoordinateTransform(
-            QgsCoordinateReferenceSystem.fromEpsgId(4326),
-            QgsCoordinateReferenceSystem.fromEpsgId(3857),
-            QgsProject.instance(),
-        )
+        self.tile_image_size = QSize(tile_size, tile_size)
 
         canvas_settings = iface.mapCanvas().mapSettings()
         self.render_settings = QgsMapSettings(canvas_settings)
 
-        self.render_settings.setDestinationCrs(
-            QgsCoordinateReferenceSystem.fromEpsgId(3857)
-        )
+        self.render_settings.setDestinationCrs(utils.web_mercator_crs())
         self.render_settings.setLayers(layers)
         self.render_settings.setOutputDpi(self.dpi)
-        self.render_settings.setOutputSize(image.size())
+        self.render_settings.setOutputSize(self.tile_image_size)
         self.render_settings.setDevicePixelRatio(1.0)
 
         if antialiasing:
@@ -178,46 +179,79 @@ class TilingThread(QThread):
         )
         self.render_settings.setLabelingEngineSettings(labeling_settings)
 
-        background_red = QgsProject.instance().readNumEntry(
-            "Gui", "/CanvasColorRedPart", 255
-        )[0]
-        background_green = QgsProject.instance().readNumEntry(
-            "Gui", "/CanvasColorGreenPart", 255
-        )[0]
-        background_blue = QgsProject.instance().readNumEntry(
-            "Gui", "/CanvasColorBluePart", 255
-        )[0]
-
         alpha = 0 if is_background_transparent else 255
-        background_color = QColor(
-            background_red,
-            background_green,
-            background_blue,
-            alpha,
-        )
+        background_color = self._project_canvas_color(alpha)
 
         self.render_settings.setBackgroundColor(background_color)
 
-        self.image = QImage(
-            self.render_settings.outputSize(),
-            QImage.Format.Format_ARGB32_Premultiplied,
+        self.dots_per_meter = round(self.dpi / 25.4 * 1000)
+        self.render_batch_size = max(1, QThread.idealThreadCount())
+        self._free_images: List[QImage] = []
+
+        self.layers_extent = self._layers_web_mercator_extent(layers)
+        self._blank_image: Optional[QImage] = None
+
+    def _project_canvas_color(self, alpha: int) -> QColor:
+        """
+        Reads the map canvas background color stored in the project.
+
+        :param alpha: The alpha channel of the resulting color.
+
+        :returns: The canvas background color.
+        """
+        project = QgsProject.instance()
+        red, green, blue = (
+            project.readNumEntry("Gui", f"/CanvasColor{part}Part", 255)[0]
+            for part in ("Red", "Green", "Blue")
         )
 
-        dpm = round(self.dpi / 25.4 * 1000)
-        self.image.setDotsPerMeterX(dpm)
-        self.image.setDotsPerMeterY(dpm)
+        return QColor(red, green, blue, alpha)
+
+    def _layers_web_mercator_extent(
+        self, layers: List[QgsMapLayer]
+    ) -> Optional[QgsRectangle]:
+        """
+        Computes the combined extent of the layers in EPSG:3857.
+
+        Only raster layers are known to draw nothing outside their
+        extent. Vector symbols, labels and renderers such as heatmaps
+        or inverted polygons may paint tiles far away from it, so no
+        extent is returned as soon as any other layer is rendered.
+
+        :param layers: The map layers to render.
+
+        :returns: The combined layers extent, or None if tiles outside
+            of it may still get painted or if some layer extent could
+            not be reprojected.
+        """
+        if any(layer.type() != LayerType.Raster for layer in layers):
+            return None
+
+        layers_extent = QgsRectangle()
+        layers_extent.setMinimal()
+
+        for layer in layers:
+            transform = utils.cached_transform(
+                layer.crs(), utils.web_mercator_crs()
+            )
+            try:
+                layer_extent = transform.transformBoundingBox(layer.extent())
+            except QgsCsException:
+                return None
+
+            layers_extent.combineExtentWith(layer_extent)
+
+        return layers_extent
 
     def run(self) -> None:
         """
         Starts the tile generation process in the background thread.
 
-        Renders tiles sequentially and writes them using the selected
+        Renders tiles in parallel batches and writes them using the selected
         tile writer; after rendering completes, auxiliary artifacts
         (overview, metadata, viewers) are generated if requested.
         """
-        self.mutex.lock()
-        self.stopMe = 0
-        self.mutex.unlock()
+        self._stop_requested = False
 
         self.interrupted = False
         self.error = None
@@ -281,15 +315,9 @@ class TilingThread(QThread):
             return
 
         self.rangeChanged.emit(
-            self.tr("Rendering: %v from %m (%p%)"), len(self.tiles)
+            self.tr("Rendering: %v from %m (%p%)"), self.tiles_count
         )
-        for tile in self.tiles:
-            if self._is_stop_requested():
-                self.interrupted = True
-                return
-
-            self.render(tile)
-            self.updateProgress.emit()
+        self._render_tiles()
 
         if self._is_stop_requested():
             self.interrupted = True
@@ -315,9 +343,7 @@ class TilingThread(QThread):
         This method sets a flag to interrupt the thread and halt the
         generation of remaining tiles.
         """
-        self.mutex.lock()
-        self.stopMe = 1
-        self.mutex.unlock()
+        self._stop_requested = True
         QThread.wait(self)
 
     def _is_stop_requested(self) -> bool:
@@ -326,10 +352,7 @@ class TilingThread(QThread):
 
         :returns: True if cancellation was requested, otherwise False.
         """
-        self.mutex.lock()
-        stop_me = self.stopMe
-        self.mutex.unlock()
-        return stop_me == 1
+        return self._stop_requested
 
     def _cancel_writer(self) -> None:
         """
@@ -345,21 +368,178 @@ class TilingThread(QThread):
         except Exception:
             logger.exception("Failed to cancel tiles writer.")
 
-    def render(self, tile: Tile) -> None:
+    def _render_tiles(self) -> None:
+        """
+        Renders all tiles and passes them to the writer.
+
+        Tiles are rendered in parallel batches. The next batch is
+        started before the previous one is written, so encoding and
+        writing overlap with rendering while the writer is only
+        called from this thread.
+        """
+        rendered_count = 0
+        last_progress_time = time.monotonic()
+        tiles = iter(self.tiles)
+        pending_jobs: List[RenderJob] = []
+
+        try:
+            while True:
+                if self._is_stop_requested():
+                    self.interrupted = True
+                    return
+
+                tiles_batch = list(islice(tiles, self.render_batch_size))
+                started_jobs = self.start_render_jobs(tiles_batch)
+                rendered_jobs, pending_jobs = pending_jobs, started_jobs
+
+                if rendered_jobs:
+                    self.write_rendered_tiles(rendered_jobs)
+
+                    rendered_count += len(rendered_jobs)
+                    now = time.monotonic()
+                    if (
+                        rendered_count >= self.PROGRESS_BATCH_SIZE
+                        or now - last_progress_time >= self.PROGRESS_INTERVAL
+                    ):
+                        self.updateProgress.emit(rendered_count)
+                        rendered_count = 0
+                        last_progress_time = now
+
+                if not pending_jobs:
+                    break
+        finally:
+            self._cancel_render_jobs(pending_jobs)
+
+        if rendered_count > 0:
+            self.updateProgress.emit(rendered_count)
+
+    def start_render_jobs(self, tiles: List[Tile]) -> List[RenderJob]:
         """
-        Renders a single tile based on the provided tile object.
+        Starts rendering a batch of tiles concurrently.
 
-        This method processes a tile by rendering it to an image,
-        using map settings and transforms.
+        Every tile gets its own map settings, image and painter,
+        so the render jobs of the batch run in parallel. When only
+        raster layers are rendered, tiles lying more than a tile away
+        from every layer are not rendered and get a background filled
+        image.
+
+        :param tiles: The tiles to render.
+
+        :returns: The render jobs, in tiles order.
+        """
+        jobs = []
+        for tile in tiles:
+            tile_extent = tile.to_web_mercator_rectangle()
+            if self.layers_extent is not None and not tile_extent.buffered(
+                tile_extent.width()
+            ).intersects(self.layers_extent):
+                jobs.append((tile, self._background_image(), None, None))
+                continue
+
+            tile_settings = QgsMapSettings(self.render_settings)
+            tile_settings.setExtent(tile_extent)
+
+            image = self._acquire_tile_image()
+            painter = QPainter(image)
+            job = QgsMapRendererCustomPainterJob(tile_settings, painter)
+            job.start()
+
+            jobs.append((tile, image, painter, job))
+
+        return jobs
+
+    def write_rendered_tiles(self, jobs: List[RenderJob]) -> None:
+        """
+        Waits for the render jobs and writes their tiles in order.
+
+        :param jobs: The render jobs started by :py:meth:`start_render_jobs`.
+        """
+        for _, _, painter, job in jobs:
+            if job is None:
+                continue
+
+            job.waitForFinished()
+            painter.end()
+
+        for tile, image, _, _ in jobs:
+            self.writer.write_tile(
+                tile,
+                image,
+                self.format,
+                self.quality,
+                release_image=self._release_tile_image,
+            )
+
+    def _cancel_render_jobs(self, jobs: List[RenderJob]) -> None:
+        """
+        Cancels render jobs which results will not be written.
+
+        :param jobs: The render jobs to cancel.
+        """
+        for _, _, painter, job in jobs:
+            if job is None:
+                continue
+
+            job.cancel()
+            painter.end()
+
+        self._release_tile_images(jobs)
+
+    def _release_tile_images(self, jobs: List[RenderJob]) -> None:
         """
-        tile_extent = self.projector.transform(tile.to_rectangle())
-        self.render_settings.setExtent(tile_extent)
+        Returns the images of finished render jobs to the image pool.
 
-        self.image.fill(Qt.GlobalColor.transparent)
+        :param jobs: The finished render jobs.
+        """
+        self._free_images.extend(
+            image for _, image, _, job in jobs if job is not None
+        )
+
+    def _release_tile_image(self, image: QImage) -> None:
+        """
+        Returns an image the writer is done with to the image pool.
+
+        The shared background image is never changed, so it stays
+        out of the pool.
+
+        :param image: The written tile image.
+        """
+        if image is not self._blank_image:
+            self._free_images.append(image)
+
+    def _background_image(self) -> QImage:
+        """
+        Returns the image of a tile without any rendered layer.
+
+        :returns: The tile image filled with the background color.
+        """
+        if self._blank_image is None:
+            self._blank_image = self._acquire_tile_image()
+            self._blank_image.fill(self.render_settings.backgroundColor())
+
+        return self._blank_image
+
+    def _acquire_tile_image(self) -> QImage:
+        """
+        Returns a cleared image to render a tile on.
+
+        Images of written tiles are reused, so only as many images
+        as there are tiles in flight are ever allocated. Writers may
+        return images from their encoding threads; list appends and
+        pops are atomic and images are only taken on this thread.
+
+        :returns: The transparent tile image.
+        """
+        if self._free_images:
+            image = self._free_images.pop()
+        else:
+            image = QImage(
+                self.tile_image_size,
+                QImage.Format.Format_ARGB32_Premultiplied,
+            )
+            image.setDotsPerMeterX(self.dots_per_meter)
+            image.setDotsPerMeterY(self.dots_per_meter)
 
-        painter = QPainter(self.image)
-        job = QgsMapRendererCustomPainterJob(self.render_settings, painter)
-        job.renderSynchronously()
-        painter.end()
+        image.fill(Qt.GlobalColor.transparent)
 
-        self.writer.write_tile(tile, self.image, self.format, self.quality)
+        return image
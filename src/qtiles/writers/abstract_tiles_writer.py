@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Callable, Optional
 
 from qgis.PyQt.QtGui import QImage
 
@@ -17,10 +18,16 @@ class AbstractTilesWriter(ABC):
         image: QImage,
         image_format: str,
         quality: int,
+        release_image: Optional[Callable[[QImage], None]] = None,
     ) -> None:
         """
         Writes a single tile to the output storage.
 
+        Without ``release_image`` the image may be reused by the caller
+        as soon as this method returns. Otherwise the writer keeps
+        the image until it is no longer needed and then passes it
+        to ``release_image``; the caller must not change it before.
+
         :param tile: Tile descriptor containing z, x, y coordinates.
         :type tile: Tile
         :param image: Rendered tile image.
@@ -29,6 +36,9 @@ class AbstractTilesWriter(ABC):
         :type image_format: str
         :param quality: The image quality (0–100)
         :type quality: int
+        :param release_image: Callback receiving the image once
+            the writer is done with it.
+        :type release_image: Optional[Callable[[QImage], None]]
 
         :returns: None.
         """
@@ -1,87 +1,142 @@
+import os
 from pathlib import Path
+from typing import Optional, Set, Tuple
 
 from qgis.core import QgsApplication
-from qgis.PyQt.QtGui import QImage
 
+from qtiles.core.exceptions import TileGenerationError
 from qtiles.tile import Tile
-from qtiles.writers.abstract_tiles_writer import AbstractTilesWriter
-from qtiles.writers.utils import ensure_operation_succeeded
+from qtiles.writers.encoding_tiles_writer import EncodingTilesWriter
+from qtiles.writers.utils import (
+    TILE_WRITE_BUFFER_SIZE,
+    ensure_operation_succeeded,
+)
 
 
-class DirectoryTilesWriter(AbstractTilesWriter):
+class DirectoryTilesWriter(EncodingTilesWriter):
     """
     Writes tiles to a directory structure on disk.
     """
 
-    def __init__(self, *, output_path: Path, root_dir: str) -> None:
+    def __init__(
+        self, *, output_path: Path, root_dir: str, image_format: str
+    ) -> None:
         """
         Initializes the DirectoryWriter with the output path and root directory.
 
         :param output_path: The base directory where tiles will be saved.
         :param root_dir: The root directory name for the tile structure.
+        :param image_format: Image format (e.g. 'PNG', 'JPEG').
         """
-        self.__output_path = output_path
-        self.__root_dir = root_dir
-
-    def write_tile(
-        self,
-        tile: Tile,
-        image: QImage,
-        image_format: str,
-        quality: int,
-    ) -> None:
+        super().__init__()
+
+        self.__tile_extension = image_format.lower()
+        self.__tiles_dir = str(output_path / root_dir)
+        self.__created_dirs: Set[Tuple[int, int]] = set()
+
+    def _store_tile(self, tile: Tile, data: Optional[bytes]) -> None:
         """
-        Writes a single tile image to the appropriate directory.
+        Writes an encoded tile to the appropriate directory.
 
         :param tile: Tile descriptor.
         :type tile: Tile
-        :param image: The tile image to save.
-        :type image: QImage
-        :param image_format: The image format (e.g., 'PNG', 'JPEG') to use for saving.
-        :type image_format: str
-        :param quality: The image quality (0–100)
-        :type quality: int
+        :param data: Encoded tile image, or ``None`` if encoding failed.
+        :type data: Optional[bytes]
 
         :returns: None
         """
-
-        dir_path = (
-            self.__output_path / self.__root_dir / str(tile.z) / str(tile.x)
-        )
-        dir_path.mkdir(parents=True, exist_ok=True)
-
-        tile_file = dir_path / f"{tile.y}.{image_format.lower()}"
         # fmt: off
         ensure_operation_succeeded(
-            image.save(str(tile_file), image_format, quality),
-            log_message=f"Failed to save tile to disk: {tile_file}",
+            data is not None,
+            log_message="Failed to encode tile image for directory output",
             user_message=QgsApplication.translate(
                 "QTiles", "Failed to write one of the generated tiles."
             ),
             detail=QgsApplication.translate(
                 "QTiles",
-                "Tile {z}/{x}/{y} could not be saved to '{path}'."
+                "Tile {z}/{x}/{y} could not be encoded before writing "
+                "to disk."
             ).format(
                 z=tile.z,
                 x=tile.x,
                 y=tile.y,
-                path=tile_file,
             ),
         )
         # fmt: on
 
+        self.__write_tile_file(tile, data)
+
+    def __write_tile_file(self, tile: Tile, data: bytes) -> None:
+        """
+        Saves encoded tile data into its file.
+
+        :param tile: Tile descriptor.
+        :type tile: Tile
+        :param data: Encoded tile image.
+        :type data: bytes
+
+        :returns: None
+        """
+        tile_file = self.__prepare_tile_file(tile)
+
+        try:
+            with open(
+                tile_file, "wb", buffering=TILE_WRITE_BUFFER_SIZE
+            ) as tile_output:
+                tile_output.write(data)
+        except IOError as error:
+            # fmt: off
+            raise TileGenerationError(
+                log_message=f"Failed to save tile to disk: {tile_file}",
+                user_message=QgsApplication.translate(
+                    "QTiles", "Failed to write one of the generated tiles."
+                ),
+                detail=QgsApplication.translate(
+                    "QTiles",
+                    "Tile {z}/{x}/{y} could not be saved to '{path}'."
+                ).format(
+                    z=tile.z,
+                    x=tile.x,
+                    y=tile.y,
+                    path=tile_file,
+                ),
+            ) from error
+            # fmt: on
+
+    def __prepare_tile_file(self, tile: Tile) -> str:
+        """
+        Creates the column directory of a tile if needed.
+
+        :param tile: Tile descriptor.
+        :type tile: Tile
+
+        :returns: Path of the tile file.
+        :rtype: str
+        """
+        z, x, y = tile.z, tile.x, tile.y
+        dir_path = f"{self.__tiles_dir}/{z}/{x}"
+        dir_key = (z, x)
+        if dir_key not in self.__created_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            self.__created_dirs.add(dir_key)
+
+        return f"{dir_path}/{y}.{self.__tile_extension}"
+
     def finalize(self) -> None:
         """
-        Finalizes tile writing (e.g., closing files, archiving).
+        Finalizes tile writing by saving the tiles still being encoded.
 
-        There is no need to do anything for the directory writer.
+        :returns: None
         """
-        pass
+        try:
+            self._store_pending_tiles()
+        finally:
+            self._shutdown_encoder()
 
     def cancel(self) -> None:
         """
-        Cancels tile writing.
+        Cancels tile writing and discards the tiles still being encoded.
 
-        There are no persistent resources to release for directory output.
+        :returns: None
         """
-        pass
+        self._shutdown_encoder()
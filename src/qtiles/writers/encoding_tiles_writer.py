@@ -0,0 +1,87 @@
+from abc import abstractmethod
+from typing import Callable, Optional
+
+from qgis.PyQt.QtGui import QImage
+
+from qtiles.tile import Tile
+from qtiles.writers.abstract_tiles_writer import AbstractTilesWriter
+from qtiles.writers.tile_encoder import TileEncoder
+
+
+class EncodingTilesWriter(AbstractTilesWriter):
+    """
+    Base class for writers storing tiles encoded on a thread pool.
+
+    Tile images are encoded by a :py:class:`TileEncoder`, and
+    the encoded tiles are passed to :py:meth:`_store_tile`
+    in submission order on the thread calling the writer.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes the tile encoder of the writer.
+        """
+        self.__encoder = TileEncoder()
+        self.__submit_tile = self.__encoder.submit
+
+    def write_tile(
+        self,
+        tile: Tile,
+        image: QImage,
+        image_format: str,
+        quality: int,
+        release_image: Optional[Callable[[QImage], None]] = None,
+    ) -> None:
+        """
+        Schedules a single tile for encoding and stores the tiles
+        whose encoding is already finished.
+
+        :param tile: Tile descriptor containing z, x, y coordinates.
+        :type tile: Tile
+        :param image: Rendered tile image.
+        :type image: QImage
+        :param image_format: Image format (e.g., 'PNG', 'JPEG').
+        :type image_format: str
+        :param quality: Image quality (0–100).
+        :type quality: int
+        :param release_image: Callback receiving the image once
+            the writer is done with it.
+        :type release_image: Optional[Callable[[QImage], None]]
+
+        :returns: None
+        """
+        for encoded_tile, data in self.__submit_tile(
+            tile, image, image_format, quality, release_image
+        ):
+            self._store_tile(encoded_tile, data)
+
+    @abstractmethod
+    def _store_tile(self, tile: Tile, data: Optional[bytes]) -> None:
+        """
+        Writes an encoded tile to the output storage.
+
+        :param tile: Tile descriptor containing z, x, y coordinates.
+        :type tile: Tile
+        :param data: Encoded tile image, or ``None`` if encoding failed.
+        :type data: Optional[bytes]
+
+        :returns: None
+        """
+        raise NotImplementedError
+
+    def _store_pending_tiles(self) -> None:
+        """
+        Waits for the tiles still being encoded and stores them.
+
+        :returns: None
+        """
+        for tile, data in self.__encoder.drain():
+            self._store_tile(tile, data)
+
+    def _shutdown_encoder(self) -> None:
+        """
+        Discards the tiles still being encoded and stops the encoder.
+
+        :returns: None
+        """
+        self.__encoder.shutdown()
@@ -1,25 +1,63 @@
+import hashlib
 import sqlite3
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple, Union
 
 from qgis.core import QgsApplication, QgsRectangle
-from qgis.PyQt.QtCore import QBuffer, QByteArray
-from qgis.PyQt.QtGui import QImage
 
 from qtiles.external.mbutil import mbutils
 from qtiles.tile import Tile
-from qtiles.writers.abstract_tiles_writer import AbstractTilesWriter
+from qtiles.writers.encoding_tiles_writer import EncodingTilesWriter
 from qtiles.writers.utils import ensure_operation_succeeded
 
-
-class MBTilesWriter(AbstractTilesWriter):
+_INSERT_TILE_SQL = """
+    INSERT INTO tiles(
+        zoom_level,
+        tile_column,
+        tile_row,
+        tile_data
+    )
+    VALUES (?, ?, ?, ?);
+"""
+_INSERT_MAP_SQL = """
+    INSERT INTO map(
+        zoom_level,
+        tile_column,
+        tile_row,
+        tile_id
+    )
+    VALUES (?, ?, ?, ?);
+"""
+_INSERT_IMAGE_SQL = """
+    INSERT INTO images(tile_id, tile_data) VALUES (?, ?);
+"""
+
+
+class MBTilesWriter(EncodingTilesWriter):
     """
     Writes tiles into an MBTiles SQLite database.
 
-    This writer stores tiles and required MBTiles metadata,
-    and optionally applies tile compression on finalize.
+    This writer stores tiles and required MBTiles metadata.
+    With compression enabled identical tiles are stored once
+    in the images table and referenced from the map table.
     """
 
+    TILES_BATCH_SIZE: int = 1000
+
+    # Tiles are appended to the write-ahead log, which is
+    # checkpointed into the database once on finalize
+    BULK_LOAD_PRAGMAS = (
+        "PRAGMA journal_mode=WAL;",
+        "PRAGMA wal_autocheckpoint=0;",
+        "PRAGMA temp_store=MEMORY;",
+        "PRAGMA cache_size=-65536;",
+    )
+    RESTORED_PRAGMAS = (
+        "PRAGMA wal_checkpoint(TRUNCATE);",
+        "PRAGMA journal_mode=DELETE;",
+        "PRAGMA synchronous=NORMAL;",
+    )
+
     def __init__(
         self,
         *,
@@ -49,7 +87,17 @@ class MBTilesWriter(AbstractTilesWriter):
         :param compression: Whether to apply tile compression.
         :type compression: bool
         """
+        super().__init__()
+
         self.__compression = compression
+        self.__pending_tiles: List[
+            Tuple[int, int, int, Union[bytes, int]]
+        ] = []
+        self.__pending_images: List[Tuple[int, bytes]] = []
+        self.__image_ids: Dict[bytes, int] = {}
+        self.__insert_tile_sql = (
+            _INSERT_MAP_SQL if compression else _INSERT_TILE_SQL
+        )
 
         bounds = (
             f"{extent.xMinimum()},"
@@ -67,6 +115,15 @@ class MBTilesWriter(AbstractTilesWriter):
         mbutils.optimize_connection(self.__cursor)
         mbutils.mbtiles_setup(self.__cursor)
 
+        # The unique tiles index is built once on finalize
+        # instead of being updated on every insert.
+        self.__cursor.execute("DROP INDEX IF EXISTS tile_index;")
+
+        # Compressed tiles are deduplicated while they are written
+        # instead of in a separate pass over the tiles table.
+        if compression:
+            mbutils.compression_prepare(self.__cursor, silent=True)
+
         self.__cursor.executemany(
             """INSERT INTO metadata(name, value) VALUES (?, ?);""",
             [
@@ -83,51 +140,29 @@ class MBTilesWriter(AbstractTilesWriter):
 
         self.__connection.commit()
 
-    def write_tile(
-        self,
-        tile: Tile,
-        image: QImage,
-        image_format: str,
-        quality: int,
-    ) -> None:
+        # Journal settings can not change inside a transaction,
+        # so the bulk load settings are applied before it starts
+        for pragma in self.BULK_LOAD_PRAGMAS:
+            self.__cursor.execute(pragma)
+
+        # All tiles are inserted in a single transaction
+        # committed on finalize.
+        self.__cursor.execute("BEGIN;")
+
+    def _store_tile(self, tile: Tile, data: Optional[bytes]) -> None:
         """
-        Inserts a single tile into the MBTiles database.
+        Buffers an encoded tile for insertion into the database.
 
         :param tile: Tile descriptor containing z, x, y coordinates.
         :type tile: Tile
-        :param image: Rendered tile image.
-        :type image: QImage
-        :param image_format: Image format (e.g., 'PNG', 'JPEG').
-        :type image_format: str
-        :param quality: Image quality (0–100).
-        :type quality: int
+        :param data: Encoded tile image, or ``None`` if encoding failed.
+        :type data: Optional[bytes]
 
         :returns: None
         """
-        data = QByteArray()
-        buffer = QBuffer(data)
         # fmt: off
         ensure_operation_succeeded(
-            buffer.open(QBuffer.OpenModeFlag.WriteOnly),
-            log_message="Failed to open MBTiles buffer for tile encoding",
-            user_message=QgsApplication.translate(
-                "QTiles", "Failed to write one of the generated tiles."
-            ),
-            detail=QgsApplication.translate(
-                "QTiles",
-                "Could not allocate an in-memory buffer for MBTiles tile "
-                "{z}/{x}/{y}."
-            ).format(
-                z=tile.z,
-                x=tile.x,
-                y=tile.y,
-            ),
-        )
-        # fmt: on
-
-        # fmt: off
-        ensure_operation_succeeded(
-            image.save(buffer, image_format, quality),
+            data is not None,
             log_message="Failed to encode tile image for MBTiles",
             user_message=QgsApplication.translate(
                 "QTiles", "Failed to write one of the generated tiles."
@@ -144,32 +179,57 @@ class MBTilesWriter(AbstractTilesWriter):
         )
         # fmt: on
 
-        self.__cursor.execute(
-            """
-            INSERT INTO tiles(
-                zoom_level,
-                tile_column,
-                tile_row,
-                tile_data
-            )
-            VALUES (?, ?, ?, ?);
-            """,
-            (
-                tile.z,
-                tile.x,
-                tile.y,
-                sqlite3.Binary(data),
-            ),
-        )
+        tile_data = self.__image_id(data) if self.__compression else data
 
-        buffer.close()
+        pending_tiles = self.__pending_tiles
+        pending_tiles.append((tile.z, tile.x, tile.y, tile_data))
+
+        if len(pending_tiles) >= self.TILES_BATCH_SIZE:
+            self.__flush_pending_tiles()
+
+    def __image_id(self, data: bytes) -> int:
+        """
+        Returns the id of a unique tile image, buffering the image
+        for insertion if it has not been seen before.
+
+        :param data: Encoded tile image.
+        :type data: bytes
+
+        :returns: Tile image id in the images table.
+        :rtype: int
+        """
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        image_id = self.__image_ids.get(digest)
+        if image_id is None:
+            image_id = len(self.__image_ids) + 1
+            self.__image_ids[digest] = image_id
+            self.__pending_images.append((image_id, data))
+
+        return image_id
+
+    def __flush_pending_tiles(self) -> None:
+        """
+        Inserts the buffered tiles into the database.
+
+        :returns: None
+        """
+        if self.__pending_images:
+            self.__cursor.executemany(_INSERT_IMAGE_SQL, self.__pending_images)
+            self.__pending_images.clear()
+
+        if not self.__pending_tiles:
+            return
+
+        self.__cursor.executemany(self.__insert_tile_sql, self.__pending_tiles)
+        self.__pending_tiles.clear()
 
     def finalize(self) -> None:
         """
         Finalizes MBTiles writing.
 
-        Commits pending changes, optionally compresses tile data,
-        optimizes the database, and closes the connection.
+        Builds the tiles index (or the compressed tiles view),
+        commits the tiles transaction, restores durable journal
+        settings, optimizes the database, and closes the connection.
 
         :returns: None
         """
@@ -180,26 +240,32 @@ class MBTilesWriter(AbstractTilesWriter):
             return
 
         try:
-            connection.commit()
-
-            if self.__compression:
-                mbutils.compression_prepare(cursor, connection)
+            self._store_pending_tiles()
+            self._shutdown_encoder()
 
-                cursor.execute("SELECT COUNT(zoom_level) FROM tiles;")
-                total_tiles = cursor.fetchone()[0]
+            self.__flush_pending_tiles()
 
-                mbutils.compression_do(
-                    cursor,
-                    connection,
-                    total_tiles,
-                    silent=False,
-                )
+            if self.__compression:
+                connection.commit()
                 mbutils.compression_finalize(
                     cursor,
                     connection,
                     silent=False,
                 )
-                connection.commit()
+            else:
+                cursor.execute(
+                    """
+                    CREATE UNIQUE INDEX tile_index ON tiles(
+                        zoom_level,
+                        tile_column,
+                        tile_row
+                    );
+                    """
+                )
+            connection.commit()
+
+            for pragma in self.RESTORED_PRAGMAS:
+                cursor.execute(pragma)
 
             mbutils.optimize_database(connection, silent=False)
         finally:
@@ -224,6 +290,10 @@ class MBTilesWriter(AbstractTilesWriter):
 
         self.__cursor = None
         self.__connection = None
+        self.__pending_tiles.clear()
+        self.__pending_images.clear()
+        self.__image_ids.clear()
+        self._shutdown_encoder()
 
         if cursor is not None:
             cursor.close()
@@ -1,18 +1,19 @@
 import json
 import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import BinaryIO, Dict, Optional
 
 from qgis.core import QgsApplication
-from qgis.PyQt.QtCore import QIODevice, QTemporaryFile
-from qgis.PyQt.QtGui import QImage
 
 from qtiles.tile import Tile
-from qtiles.writers.abstract_tiles_writer import AbstractTilesWriter
-from qtiles.writers.utils import ensure_operation_succeeded
+from qtiles.writers.encoding_tiles_writer import EncodingTilesWriter
+from qtiles.writers.utils import (
+    ARCHIVE_WRITE_BUFFER_SIZE,
+    ensure_operation_succeeded,
+)
 
 
-class NGMArchiveTilesWriter(AbstractTilesWriter):
+class NGMArchiveTilesWriter(EncodingTilesWriter):
     """
     Writes tiles into an NGM archive.
 
@@ -22,8 +23,22 @@ class NGMArchiveTilesWriter(AbstractTilesWriter):
     """
 
     __archive_root_dir = "Mapnik"
-
-    def __init__(self, *, output_path: Path, root_dir: str) -> None:
+    __archive_root_prefix = f"{__archive_root_dir}/"
+
+    RENDERER_PROPERTIES = {
+        "alpha": 255,
+        "antialias": True,
+        "brightness": 0,
+        "contrast": 1,
+        "dither": True,
+        "filterbitmap": True,
+        "greyscale": False,
+        "type": "tms_renderer",
+    }
+
+    def __init__(
+        self, *, output_path: Path, root_dir: str, image_format: str
+    ) -> None:
         """
         Initializes the NGM archive writer.
 
@@ -31,69 +46,52 @@ class NGMArchiveTilesWriter(AbstractTilesWriter):
         :type output_path: Path
         :param root_dir: Tile set name
         :type root_dir: str
+        :param image_format: Image format (e.g. 'PNG', 'JPEG').
+        :type image_format: str
         """
+        super().__init__()
+
         self.__output_path = output_path
         self.__root_dir = root_dir
+        self.__tile_extension = image_format.lower()
 
-        self.__zip_file = zipfile.ZipFile(
+        self.__archive_file: Optional[BinaryIO] = open(
             str(self.__output_path),
-            mode="w",
-            allowZip64=True,
+            "wb",
+            buffering=ARCHIVE_WRITE_BUFFER_SIZE,
         )
+        try:
+            self.__zip_file: Optional[zipfile.ZipFile] = zipfile.ZipFile(
+                self.__archive_file,
+                mode="w",
+                compression=zipfile.ZIP_STORED,
+                allowZip64=True,
+            )
+        except Exception:
+            # ZipFile does not take ownership of a file object
+            # it failed to open an archive in.
+            self.__archive_file.close()
+            raise
 
-        self.__temp_file = QTemporaryFile()
-        self.__temp_file.setAutoRemove(False)
-        # fmt: off
-        ensure_operation_succeeded(
-            self.__temp_file.open(QIODevice.OpenModeFlag.WriteOnly),
-            log_message="Failed to create temporary file for NextGIS Mobile archive",
-            user_message=QgsApplication.translate(
-                "QTiles", "Failed to prepare tile archive output."
-            ),
-            detail=QgsApplication.translate(
-                "QTiles",
-                "Could not create a temporary file used for NextGIS Mobile "
-                "export."
-            ),
-        )
-        # fmt: on
-        self.__temp_file_name = self.__temp_file.fileName()
-        self.__temp_file.close()
+        self.__write_entry = self.__zip_file.writestr
 
-        self.__levels: Dict[int, Dict[str, List[int]]] = {}
+        self.__levels: Dict[int, Dict[str, int]] = {}
 
-    def write_tile(
-        self,
-        tile: Tile,
-        image: QImage,
-        image_format: str,
-        quality: int,
-    ) -> None:
+    def _store_tile(self, tile: Tile, data: Optional[bytes]) -> None:
         """
-        Writes a single tile into the NGM archive and records
-        its coordinates for metadata generation.
+        Writes an encoded tile into the NGM archive and extends
+        the bounding box of its zoom level for metadata generation.
 
         :param tile: Tile descriptor containing z, x, y coordinates.
         :type tile: Tile
-        :param image: Rendered tile image.
-        :type image: QImage
-        :param image_format: Image format (e.g., 'PNG', 'JPEG').
-        :type image_format: str
-        :param quality: Image quality (0–100).
-        :type quality: int
+        :param data: Encoded tile image, or ``None`` if encoding failed.
+        :type data: Optional[bytes]
 
         :returns: None
         """
-        tile_path = (
-            f"{self.__archive_root_dir}/"
-            f"{tile.z}/"
-            f"{tile.x}/"
-            f"{tile.y}.{image_format.lower()}"
-        )
-
         # fmt: off
         ensure_operation_succeeded(
-            image.save(self.__temp_file_name, image_format, quality),
+            data is not None,
             log_message="Failed to encode tile image for NextGIS Mobile archive",
             user_message=QgsApplication.translate(
                 "QTiles", "Failed to write one of the generated tiles."
@@ -109,13 +107,38 @@ class NGMArchiveTilesWriter(AbstractTilesWriter):
             ),
         )
         # fmt: on
-        self.__zip_file.write(self.__temp_file_name, arcname=tile_path)
 
-        level = self.__levels.get(tile.z, {"x": [], "y": []})
-        level["x"].append(tile.x)
-        level["y"].append(tile.y)
+        z, x, y = tile.z, tile.x, tile.y
+        tile_path = (
+            f"{self.__archive_root_prefix}{z}/{x}/{y}.{self.__tile_extension}"
+        )
+
+        # Encoded PNG and JPEG tiles do not shrink any further
+        self.__write_entry(
+            tile_path,
+            data,
+            compress_type=zipfile.ZIP_STORED,
+        )
+
+        level = self.__levels.get(z)
+        if level is None:
+            self.__levels[z] = {
+                "bbox_maxx": x,
+                "bbox_maxy": y,
+                "bbox_minx": x,
+                "bbox_miny": y,
+            }
+            return
+
+        if x > level["bbox_maxx"]:
+            level["bbox_maxx"] = x
+        elif x < level["bbox_minx"]:
+            level["bbox_minx"] = x
 
-        self.__levels[tile.z] = level
+        if y > level["bbox_maxy"]:
+            level["bbox_maxy"] = y
+        elif y < level["bbox_miny"]:
+            level["bbox_miny"] = y
 
     def finalize(self) -> None:
         """
@@ -124,25 +147,21 @@ class NGMArchiveTilesWriter(AbstractTilesWriter):
 
         :returns: None
         """
-        if self.__levels:
-            self.__write_metadata()
-
         try:
-            self.__zip_file.close()
+            self._store_pending_tiles()
+
+            if self.__levels:
+                self.__write_metadata()
         finally:
-            self.__remove_temporary_file()
+            self.__close_archive()
 
     def cancel(self) -> None:
         """
-        Cancels archive writing and releases temporary resources.
+        Cancels archive writing and closes the archive file.
 
         :returns: None
         """
-        if self.__zip_file is not None:
-            self.__zip_file.close()
-            self.__zip_file = None
-
-        self.__remove_temporary_file()
+        self.__close_archive()
 
     def __write_metadata(self) -> None:
         """
@@ -156,45 +175,36 @@ class NGMArchiveTilesWriter(AbstractTilesWriter):
             "max_level": max(self.__levels.keys()),
             "min_level": min(self.__levels.keys()),
             "name": self.__root_dir,
-            "renderer_properties": {
-                "alpha": 255,
-                "antialias": True,
-                "brightness": 0,
-                "contrast": 1,
-                "dither": True,
-                "filterbitmap": True,
-                "greyscale": False,
-                "type": "tms_renderer",
-            },
+            "renderer_properties": self.RENDERER_PROPERTIES,
             "tms_type": 2,
             "type": 32,
             "visible": True,
         }
 
-        for level, coords in self.__levels.items():
-            archive_info["levels"].append(
-                {
-                    "level": level,
-                    "bbox_maxx": max(coords["x"]),
-                    "bbox_maxy": max(coords["y"]),
-                    "bbox_minx": min(coords["x"]),
-                    "bbox_miny": min(coords["y"]),
-                }
-            )
+        for level, bbox in self.__levels.items():
+            archive_info["levels"].append({"level": level, **bbox})
 
-        json_bytes = json.dumps(archive_info).encode("utf-8")
+        json_text = json.dumps(archive_info, separators=(",", ":"))
         json_name = f"{self.__archive_root_dir}.json"
-        self.__zip_file.writestr(json_name, json_bytes)
+        self.__zip_file.writestr(json_name, json_text.encode("utf-8"))
 
-    def __remove_temporary_file(self) -> None:
+    def __close_archive(self) -> None:
         """
-        Removes the temporary file used for tile encoding.
+        Closes the ZIP archive and flushes the underlying archive file.
 
         :returns: None
         """
-        temp_file: Optional[QTemporaryFile] = self.__temp_file
-        if temp_file is None:
-            return
+        self._shutdown_encoder()
 
-        temp_file.remove()
-        self.__temp_file = None
+        zip_file = self.__zip_file
+        archive_file = self.__archive_file
+
+        self.__zip_file = None
+        self.__archive_file = None
+
+        try:
+            if zip_file is not None:
+                zip_file.close()
+        finally:
+            if archive_file is not None:
+                archive_file.close()
@@ -2,17 +2,15 @@ from pathlib import Path
 from typing import Optional
 
 from qgis.core import QgsApplication, QgsRectangle
-from qgis.PyQt.QtCore import QBuffer, QByteArray, QIODevice
-from qgis.PyQt.QtGui import QImage
 
 from qtiles.external.pmtiles.tile import Compression, TileType, zxy_to_tileid
 from qtiles.external.pmtiles.writer import Writer
 from qtiles.tile import Tile
-from qtiles.writers.abstract_tiles_writer import AbstractTilesWriter
+from qtiles.writers.encoding_tiles_writer import EncodingTilesWriter
 from qtiles.writers.utils import ensure_operation_succeeded
 
 
-class PMTilesWriter(AbstractTilesWriter):
+class PMTilesWriter(EncodingTilesWriter):
     """
     Writes tiles into a PMTiles archive.
     """
@@ -43,6 +41,8 @@ class PMTilesWriter(AbstractTilesWriter):
         :param extent: Geographic extent.
         :type extent: QgsRectangle
         """
+        super().__init__()
+
         self.__output_path = output_path
         self.__root_dir = root_dir
         self.__image_format = image_format
@@ -52,51 +52,22 @@ class PMTilesWriter(AbstractTilesWriter):
 
         self.__file = open(self.__output_path, "wb")
         self.__writer = Writer(self.__file)
+        self.__write_entry = self.__writer.write_tile
 
-    def write_tile(
-        self,
-        tile: Tile,
-        image: QImage,
-        image_format: str,
-        quality: int,
-    ) -> None:
+    def _store_tile(self, tile: Tile, data: Optional[bytes]) -> None:
         """
-        Writes a single tile into PMTiles archive.
+        Writes an encoded tile into PMTiles archive.
 
         :param tile: Tile descriptor containing z, x, y coordinates.
         :type tile: Tile
-        :param image: Rendered tile image.
-        :type image: QImage
-        :param image_format: Image format (e.g., 'PNG', 'JPEG').
-        :type image_format: str
-        :param quality: Image quality (0–100).
-        :type quality: int
+        :param data: Encoded tile image, or ``None`` if encoding failed.
+        :type data: Optional[bytes]
 
         :returns: None
         """
-        data = QByteArray()
-        buffer = QBuffer(data)
         # fmt: off
         ensure_operation_succeeded(
-            buffer.open(QIODevice.OpenModeFlag.WriteOnly),
-            log_message="Failed to open PMTiles buffer for tile encoding",
-            user_message=QgsApplication.translate(
-                "QTiles", "Failed to write one of the generated tiles."
-            ),
-            detail=QgsApplication.translate(
-                "QTiles",
-                "Could not allocate an in-memory buffer for PMTiles tile "
-                "{z}/{x}/{y}."
-            ).format(
-                z=tile.z,
-                x=tile.x,
-                y=tile.y,
-            ),
-        )
-        # fmt: on
-        # fmt: off
-        ensure_operation_succeeded(
-            image.save(buffer, image_format, quality),
+            data is not None,
             log_message="Failed to encode tile image for PMTiles",
             user_message=QgsApplication.translate(
                 "QTiles", "Failed to write one of the generated tiles."
@@ -112,10 +83,9 @@ class PMTilesWriter(AbstractTilesWriter):
             ),
         )
         # fmt: on
-        buffer.close()
 
         tile_id = zxy_to_tileid(tile.z, tile.x, tile.y)
-        self.__writer.write_tile(tile_id, bytes(data))
+        self.__write_entry(tile_id, data)
 
     def finalize(self) -> None:
         """
@@ -163,6 +133,8 @@ class PMTilesWriter(AbstractTilesWriter):
         }
 
         try:
+            self._store_pending_tiles()
+
             writer.finalize(header, metadata)
         finally:
             self.__writer = None
@@ -183,6 +155,8 @@ class PMTilesWriter(AbstractTilesWriter):
 
         :returns: None
         """
+        self._shutdown_encoder()
+
         file_handle: Optional[object] = self.__file
         if file_handle is None:
             return
@@ -0,0 +1,155 @@
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Deque, List, Optional, Tuple
+
+from qgis.PyQt.QtCore import QBuffer, QByteArray, QIODevice
+from qgis.PyQt.QtGui import QImage
+
+from qtiles.tile import Tile
+
+EncodedTile = Tuple[Tile, Optional[bytes]]
+
+
+class TileEncoder:
+    """
+    Encodes tile images into PNG/JPEG bytes on a pool of worker threads.
+
+    Images are encoded concurrently while results are handed back
+    in submission order, so writers keep storing tiles sequentially
+    on the calling thread.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        """
+        Starts the encoding worker threads.
+
+        :param max_workers: Number of encoding threads,
+            the CPU count by default.
+        :type max_workers: Optional[int]
+        """
+        workers_count = max_workers or os.cpu_count() or 1
+
+        self.__executor: Optional[ThreadPoolExecutor] = ThreadPoolExecutor(
+            max_workers=workers_count,
+            thread_name_prefix="qtiles_encoder",
+        )
+        self.__max_pending = 2 * workers_count
+        self.__pending: Deque[Tuple[Tile, Future]] = deque()
+        self.__buffers = threading.local()
+
+    def submit(
+        self,
+        tile: Tile,
+        image: QImage,
+        image_format: str,
+        quality: int,
+        release_image: Optional[Callable[[QImage], None]] = None,
+    ) -> List[EncodedTile]:
+        """
+        Schedules a tile image for encoding.
+
+        Without ``release_image`` the image is copied, so the caller
+        may reuse it right away. Otherwise the image itself is encoded
+        and handed to ``release_image`` once its encoding is finished
+        or cancelled. The callback may run on a worker thread.
+
+        :param tile: Tile descriptor.
+        :type tile: Tile
+        :param image: Rendered tile image.
+        :type image: QImage
+        :param image_format: Image format (e.g., 'PNG', 'JPEG').
+        :type image_format: str
+        :param quality: Image quality (0–100).
+        :type quality: int
+        :param release_image: Callback receiving the image
+            once it is no longer used.
+        :type release_image: Optional[Callable[[QImage], None]]
+
+        :returns: Encoded tiles ready to be stored, in submission order.
+            Encoded data is ``None`` when encoding failed.
+        :rtype: List[EncodedTile]
+        """
+        if release_image is None:
+            image = image.copy()
+
+        future = self.__executor.submit(
+            self.__encode, image, image_format, quality
+        )
+        if release_image is not None:
+            future.add_done_callback(lambda _: release_image(image))
+        self.__pending.append((tile, future))
+
+        encoded_tiles = []
+        while self.__pending and (
+            len(self.__pending) > self.__max_pending
+            or self.__pending[0][1].done()
+        ):
+            pending_tile, pending_future = self.__pending.popleft()
+            encoded_tiles.append((pending_tile, pending_future.result()))
+
+        return encoded_tiles
+
+    def drain(self) -> List[EncodedTile]:
+        """
+        Waits for all scheduled tiles to be encoded.
+
+        :returns: Remaining encoded tiles, in submission order.
+        :rtype: List[EncodedTile]
+        """
+        encoded_tiles = [
+            (tile, future.result()) for tile, future in self.__pending
+        ]
+        self.__pending.clear()
+
+        return encoded_tiles
+
+    def shutdown(self) -> None:
+        """
+        Discards pending tiles and stops the encoding threads.
+
+        :returns: None
+        """
+        executor = self.__executor
+        if executor is None:
+            return
+
+        self.__executor = None
+
+        for _, future in self.__pending:
+            future.cancel()
+        self.__pending.clear()
+
+        executor.shutdown(wait=True)
+
+    def __encode(
+        self, image: QImage, image_format: str, quality: int
+    ) -> Optional[bytes]:
+        """
+        Encodes an image using the buffer of the current worker thread.
+
+        :param image: Image to encode.
+        :param image_format: Image format (e.g., 'PNG', 'JPEG').
+        :param quality: Image quality (0–100).
+
+        :returns: Encoded image data, or ``None`` if encoding failed.
+        """
+        buffers = self.__buffers
+        if not hasattr(buffers, "buffer"):
+            buffers.data = QByteArray()
+            buffers.buffer = QBuffer(buffers.data)
+
+        buffer = buffers.buffer
+        if not buffer.open(
+            QIODevice.OpenModeFlag.WriteOnly | QIODevice.OpenModeFlag.Truncate
+        ):
+            return None
+
+        try:
+            if not image.save(buffer, image_format, quality):
+                return None
+        finally:
+            buffer.close()
+
+        return bytes(buffers.data)
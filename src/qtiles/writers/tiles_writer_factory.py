@@ -1,3 +1,5 @@
+from typing import Callable, Dict
+
 from qtiles.writers.abstract_tiles_writer import AbstractTilesWriter
 from qtiles.writers.directory_tiles_writer import DirectoryTilesWriter
 from qtiles.writers.enums import TilesWriterMode
@@ -8,11 +10,73 @@ from qtiles.writers.save_tiles_options import SaveTilesOptions
 from qtiles.writers.zip_tiles_writer import ZipTilesWriter
 
 
+def _create_directory_writer(options: SaveTilesOptions) -> AbstractTilesWriter:
+    """Creates a directory tiles writer."""
+    return DirectoryTilesWriter(
+        output_path=options.output_path,
+        root_dir=options.root_dir,
+        image_format=options.image_format,
+    )
+
+
+def _create_zip_writer(options: SaveTilesOptions) -> AbstractTilesWriter:
+    """Creates a ZIP archive tiles writer."""
+    return ZipTilesWriter(
+        output_path=options.output_path,
+        root_dir=options.root_dir,
+        image_format=options.image_format,
+    )
+
+
+def _create_ngm_writer(options: SaveTilesOptions) -> AbstractTilesWriter:
+    """Creates a NextGIS Mobile archive tiles writer."""
+    return NGMArchiveTilesWriter(
+        output_path=options.output_path,
+        root_dir=options.root_dir,
+        image_format=options.image_format,
+    )
+
+
+def _create_mbtiles_writer(options: SaveTilesOptions) -> AbstractTilesWriter:
+    """Creates a MBTiles tiles writer."""
+    return MBTilesWriter(
+        output_path=options.output_path,
+        root_dir=options.root_dir,
+        image_format=options.image_format,
+        min_zoom=options.min_zoom,
+        max_zoom=options.max_zoom,
+        extent=options.extent,
+        compression=options.compression,
+    )
+
+
+def _create_pmtiles_writer(options: SaveTilesOptions) -> AbstractTilesWriter:
+    """Creates a PMTiles tiles writer."""
+    return PMTilesWriter(
+        output_path=options.output_path,
+        root_dir=options.root_dir,
+        image_format=options.image_format,
+        min_zoom=options.min_zoom,
+        max_zoom=options.max_zoom,
+        extent=options.extent,
+    )
+
+
 class TilesWriterFactory:
     """
     Factory responsible for creating concrete tile writer instances.
     """
 
+    _WRITER_BUILDERS: Dict[
+        TilesWriterMode, Callable[[SaveTilesOptions], AbstractTilesWriter]
+    ] = {
+        TilesWriterMode.DIR: _create_directory_writer,
+        TilesWriterMode.ZIP: _create_zip_writer,
+        TilesWriterMode.NGM: _create_ngm_writer,
+        TilesWriterMode.MBTILES: _create_mbtiles_writer,
+        TilesWriterMode.PMTILES: _create_pmtiles_writer,
+    }
+
     @staticmethod
     def create(
         mode: TilesWriterMode, options: SaveTilesOptions
@@ -27,38 +91,11 @@ class TilesWriterFactory:
 
         :returns: Concrete instance of a tiles writer.
         :rtype: AbstractTilesWriter
+
+        :raises ValueError: If no writer exists for the mode.
         """
-        if mode is TilesWriterMode.DIR:
-            return DirectoryTilesWriter(
-                output_path=options.output_path,
-                root_dir=options.root_dir,
-            )
-        if mode is TilesWriterMode.ZIP:
-            return ZipTilesWriter(
-                output_path=options.output_path,
-                root_dir=options.root_dir,
-            )
-        if mode is TilesWriterMode.NGM:
-            return NGMArchiveTilesWriter(
-                output_path=options.output_path,
-                root_dir=options.root_dir,
-            )
-        if mode is TilesWriterMode.MBTILES:
-            return MBTilesWriter(
-                output_path=options.output_path,
-                root_dir=options.root_dir,
-                image_format=options.image_format,
-                min_zoom=options.min_zoom,
-                max_zoom=options.max_zoom,
-                extent=options.extent,
-                compression=options.compression,
-            )
-        if mode is TilesWriterMode.PMTILES:
-            return PMTilesWriter(
-                output_path=options.output_path,
-                root_dir=options.root_dir,
-                image_format=options.image_format,
-                min_zoom=options.min_zoom,
-                max_zoom=options.max_zoom,
-                extent=options.extent,
-            )
+        builder = TilesWriterFactory._WRITER_BUILDERS.get(mode)
+        if builder is None:
+            raise ValueError(f"Unsupported tiles writer mode: {mode!r}")
+
+        return builder(options)
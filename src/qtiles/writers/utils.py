@@ -11,6 +11,9 @@ from qtiles.core.exceptions import (
 )
 from qtiles.core.logging import logger
 
+ARCHIVE_WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+TILE_WRITE_BUFFER_SIZE = 64 * 1024
+
 
 def ensure_operation_succeeded(
     is_successful: bool,
@@ -1,17 +1,18 @@
 import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 from qgis.core import QgsApplication
-from qgis.PyQt.QtCore import QIODevice, QTemporaryFile
-from qgis.PyQt.QtGui import QImage
 
 from qtiles.tile import Tile
-from qtiles.writers.abstract_tiles_writer import AbstractTilesWriter
-from qtiles.writers.utils import ensure_operation_succeeded
+from qtiles.writers.encoding_tiles_writer import EncodingTilesWriter
+from qtiles.writers.utils import (
+    ARCHIVE_WRITE_BUFFER_SIZE,
+    ensure_operation_succeeded,
+)
 
 
-class ZipTilesWriter(AbstractTilesWriter):
+class ZipTilesWriter(EncodingTilesWriter):
     """
     Writes tiles into a ZIP archive.
 
@@ -20,7 +21,9 @@ class ZipTilesWriter(AbstractTilesWriter):
     <root_dir>/<z>/<x>/<y>.<format>.
     """
 
-    def __init__(self, *, output_path: Path, root_dir: str) -> None:
+    def __init__(
+        self, *, output_path: Path, root_dir: str, image_format: str
+    ) -> None:
         """
         Initializes the ZIP tiles writer.
 
@@ -28,65 +31,49 @@ class ZipTilesWriter(AbstractTilesWriter):
         :type output_path: Path
         :param root_dir: Root directory name inside the ZIP archive.
         :type root_dir: str
+        :param image_format: Image format (e.g. 'PNG', 'JPEG').
+        :type image_format: str
         """
+        super().__init__()
+
         self.__output_path = output_path
-        self.__root_dir = root_dir
+        self.__tile_extension = image_format.lower()
+        self.__root_prefix = f"{root_dir}/"
 
-        self.__zip_file = zipfile.ZipFile(
+        self.__archive_file: Optional[BinaryIO] = open(
             str(self.__output_path),
-            mode="w",
-            allowZip64=True,
-        )
-
-        self.__temp_file = QTemporaryFile()
-        self.__temp_file.setAutoRemove(False)
-        # fmt: off
-        ensure_operation_succeeded(
-            self.__temp_file.open(QIODevice.OpenModeFlag.WriteOnly),
-            log_message="Failed to create temporary file for ZIP tiles",
-            user_message=QgsApplication.translate(
-                "QTiles", "Failed to prepare tile archive output."
-            ),
-            detail=QgsApplication.translate(
-                "QTiles",
-                "Could not create a temporary file used for ZIP export."
-            ),
+            "wb",
+            buffering=ARCHIVE_WRITE_BUFFER_SIZE,
         )
-        # fmt: on
-        self.__temp_file_name = self.__temp_file.fileName()
-        self.__temp_file.close()
-
-    def write_tile(
-        self,
-        tile: Tile,
-        image: QImage,
-        image_format: str,
-        quality: int,
-    ) -> None:
+        try:
+            self.__zip_file: Optional[zipfile.ZipFile] = zipfile.ZipFile(
+                self.__archive_file,
+                mode="w",
+                compression=zipfile.ZIP_STORED,
+                allowZip64=True,
+            )
+        except Exception:
+            # ZipFile does not take ownership of a file object
+            # it failed to open an archive in.
+            self.__archive_file.close()
+            raise
+
+        self.__write_entry = self.__zip_file.writestr
+
+    def _store_tile(self, tile: Tile, data: Optional[bytes]) -> None:
         """
-        Writes a single tile image into the ZIP archive.
+        Writes an encoded tile into the ZIP archive.
 
         :param tile: Tile descriptor containing z, x, y coordinates.
         :type tile: Tile
-        :param image: Rendered tile image.
-        :type image: QImage
-        :param image_format: Image format (e.g., 'PNG', 'JPEG').
-        :type image_format: str
-        :param quality: Image quality (0–100).
-        :type quality: int
+        :param data: Encoded tile image, or ``None`` if encoding failed.
+        :type data: Optional[bytes]
 
         :returns: None
         """
-        tile_path = (
-            f"{self.__root_dir}/"
-            f"{tile.z}/"
-            f"{tile.x}/"
-            f"{tile.y}.{image_format.lower()}"
-        )
-
         # fmt: off
         ensure_operation_succeeded(
-            image.save(self.__temp_file_name, image_format, quality),
+            data is not None,
             log_message="Failed to encode tile image for ZIP archive",
             user_message=QgsApplication.translate(
                 "QTiles", "Failed to write one of the generated tiles."
@@ -102,38 +89,53 @@ class ZipTilesWriter(AbstractTilesWriter):
             ),
         )
         # fmt: on
-        self.__zip_file.write(self.__temp_file_name, arcname=tile_path)
+
+        z, x, y = tile.z, tile.x, tile.y
+        tile_path = f"{self.__root_prefix}{z}/{x}/{y}.{self.__tile_extension}"
+
+        # Encoded PNG and JPEG tiles do not shrink any further
+        self.__write_entry(
+            tile_path,
+            data,
+            compress_type=zipfile.ZIP_STORED,
+        )
 
     def finalize(self) -> None:
         """
-        Finalizes the ZIP archive and releases temporary resources.
+        Finalizes the ZIP archive and closes the archive file.
 
         :returns: None
         """
-        self.__zip_file.close()
-        self.__remove_temporary_file()
+        try:
+            self._store_pending_tiles()
+        finally:
+            self.__close_archive()
 
     def cancel(self) -> None:
         """
-        Cancels ZIP archive writing and releases temporary resources.
+        Cancels ZIP archive writing and closes the archive file.
 
         :returns: None
         """
-        if self.__zip_file is not None:
-            self.__zip_file.close()
-            self.__zip_file = None
-
-        self.__remove_temporary_file()
+        self.__close_archive()
 
-    def __remove_temporary_file(self) -> None:
+    def __close_archive(self) -> None:
         """
-        Removes the temporary file used for tile encoding.
+        Closes the ZIP archive and flushes the underlying archive file.
 
         :returns: None
         """
-        temp_file: Optional[QTemporaryFile] = self.__temp_file
-        if temp_file is None:
-            return
+        self._shutdown_encoder()
+
+        zip_file = self.__zip_file
+        archive_file = self.__archive_file
+
+        self.__zip_file = None
+        self.__archive_file = None
 
-        temp_file.remove()
-        self.__temp_file = None
+        try:
+            if zip_file is not None:
+                zip_file.close()
+        finally:
+            if archive_file is not None:
+                archive_file.close()